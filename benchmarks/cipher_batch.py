@@ -0,0 +1,40 @@
+import argparse
+import json
+import time
+
+from nsdev.code.encrypt import CipherHandler
+
+
+def best_of(func, repeat):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare per-value decrypt() with decrypt_many().")
+    parser.add_argument("--count", type=int, default=20000)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--key", default="my_s3cr3t_k3y_@2024!")
+    args = parser.parse_args()
+
+    workloads = {
+        "text": [f"session-{i}-{'x' * (i % 64)}" for i in range(args.count)],
+        "json": [json.dumps({"id": i, "tags": list(range(i % 16))}) for i in range(args.count)],
+    }
+    print(f"{'method':<8} {'values':<6} {'decrypt() s':>12} {'many s':>8} {'many raw s':>11}")
+    for method in ("bytes", "compact", "shift"):
+        cipher = CipherHandler(key=args.key, method="bytes" if method == "compact" else method)
+        for name, values in workloads.items():
+            encrypted = cipher.encrypt_many(values, compact=method == "compact", workers=1)
+            single = best_of(lambda: [cipher.decrypt(value) for value in encrypted], args.repeat)
+            batch = best_of(lambda: cipher.decrypt_many(encrypted, workers=1), args.repeat)
+            raw = best_of(lambda: cipher.decrypt_many(encrypted, parse_json=False, workers=1), args.repeat)
+            print(f"{method:<8} {name:<6} {single:>12.4f} {batch:>8.4f} {raw:>11.4f}")
+
+
+if __name__ == "__main__":
+    main()
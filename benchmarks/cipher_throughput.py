@@ -0,0 +1,42 @@
+import argparse
+import json
+import time
+
+from nsdev.code.encrypt import CipherHandler
+
+METHODS = ("bytes", "shift", "binary", "compact", "aesgcm")
+
+
+def measure(func, data, size, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        result = func(data)
+    return result, size * repeat / (time.perf_counter() - start) / (1024 * 1024)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark CipherHandler throughput in MB/s.")
+    parser.add_argument("--sizes", default="1024,1048576", help="comma separated payload sizes in characters")
+    parser.add_argument("--budget", type=int, default=8 * 1024 * 1024, help="characters processed per measurement")
+    parser.add_argument("--key", default="my_s3cr3t_k3y_@2024!")
+    args = parser.parse_args()
+
+    record = json.dumps({"user_id": 123456789, "lang": "id", "items": list(range(16))})
+    print(f"{'size':>9} {'method':<8} {'encrypt MB/s':>14} {'decrypt MB/s':>14}")
+    for size in map(int, args.sizes.split(",")):
+        payload = (record * (size // len(record) + 1))[:size]
+        repeat = max(1, args.budget // size)
+        for method in METHODS:
+            try:
+                cipher = CipherHandler(key=args.key, method="bytes" if method == "compact" else method)
+            except ImportError as e:
+                print(f"{size:>9} {method:<8} skipped: {e}")
+                continue
+            encrypted, encrypt_speed = measure(getattr(cipher, f"encrypt_{method}"), payload, size, repeat)
+            decrypted, decrypt_speed = measure(getattr(cipher, f"decrypt_{method}"), encrypted, size, repeat)
+            assert decrypted == payload
+            print(f"{size:>9} {method:<8} {encrypt_speed:>14,.1f} {decrypt_speed:>14,.1f}")
+
+
+if __name__ == "__main__":
+    main()
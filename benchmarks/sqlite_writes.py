@@ -0,0 +1,38 @@
+import argparse
+import os
+import tempfile
+import time
+
+from nsdev.data.database import DataBase
+
+
+def run(label, writes, batch, **options):
+    with tempfile.TemporaryDirectory() as tmp:
+        db = DataBase(storage_type="sqlite", file_name=os.path.join(tmp, "bench"), **options)
+        start = time.perf_counter()
+        if batch:
+            for offset in range(0, writes, batch):
+                with db.transaction():
+                    for i in range(offset, min(offset + batch, writes)):
+                        db.setVars(i % 500, f"key_{i % 20}", {"value": i})
+        else:
+            for i in range(writes):
+                db.setVars(i % 500, f"key_{i % 20}", {"value": i})
+        elapsed = time.perf_counter() - start
+        db.close()
+    print(f"{label:<40} {writes / elapsed:>12,.0f} writes/s")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark DataBase SQLite write throughput.")
+    parser.add_argument("--writes", type=int, default=2000)
+    parser.add_argument("--batch", type=int, default=100)
+    args = parser.parse_args()
+
+    run("rollback journal, synchronous=FULL", args.writes, 0, sqlite_wal=False, sqlite_synchronous="FULL")
+    run("WAL, synchronous=NORMAL", args.writes, 0)
+    run(f"WAL, transaction() x{args.batch}", args.writes, args.batch)
+
+
+if __name__ == "__main__":
+    main()
@@ -18,7 +18,7 @@ from .analytics.chat import ChatAnalyzer
 from .analytics.manager import AnalyticsManager
 from .auth.manager import AuthManager
 from .code.encrypt import AsciiManager, CipherHandler
-from .data.database import DataBase
+from .data.database import AsyncDataBase, DataBase
 from .data.storekey import KeyManager
 from .data.ymlreder import YamlHandler
 from .payment.payment import (
@@ -39,6 +39,7 @@ from .telegram.button import Button
 from .telegram.copier import MessageCopier
 from .telegram.errors import ErrorHandler
 from .telegram.formatter import TextFormatter
+from .telegram.scheduler import OutboundScheduler
 from .telegram.story import StoryDownloader
 from .telegram.videofx import VideoFX
 from .tempmail.manager import TempMailManager
@@ -100,6 +101,7 @@ class NsDev:
             Cipher=CipherHandler,
         )
         self.data = SimpleNamespace(
+            adb=AsyncDataBase,
             db=DataBase,
             key=KeyManager,
             yaml=YamlHandler(),
@@ -125,6 +127,7 @@ class NsDev:
             copier=MessageCopier(self._client),
             errors=ErrorHandler(self._client),
             formatter=TextFormatter,
+            scheduler=OutboundScheduler.for_client(self._client),
             story=StoryDownloader(self._client),
             videofx=VideoFX(),
         )
@@ -1,54 +1,140 @@
 import asyncio
+import atexit
+import os
+import threading
 import time
 from collections import Counter
 from functools import wraps
-from typing import List, Tuple
+from typing import List, Tuple, Union
 
 from pyrogram.types import Message
 
-from ..data.database import DataBase
+from ..data.database import AsyncDataBase, DataBase, call_database
+from .store import DAY, HOUR, AnalyticsStore
 
 
 class AnalyticsManager:
-    def __init__(self, database: DataBase, db_id: str = "global_analytics", var_key: str = "bot_usage_stats"):
+    def __init__(
+        self,
+        database: Union[DataBase, AsyncDataBase] = None,
+        db_id: str = "global_analytics",
+        var_key: str = "bot_usage_stats",
+        **options,
+    ):
         self.db = database
         self.db_id = db_id
         self.var_key = var_key
+        self.raw_events = options.get("raw_events", False)
+        self.flush_interval = options.get("flush_interval", 5)
+        self.flush_size = options.get("flush_size", 500)
+        self.store = options.get("store") or AnalyticsStore(
+            options.get("analytics_path") or self._default_path(database, db_id),
+            retention=options.get("retention", 7 * DAY),
+        )
+        self._pending = Counter()
+        self._events = []
+        self._buffer_lock = threading.Lock()
+        self._last_flush = time.monotonic()
+        self._migrated = database is None
+        self._migrate_lock = None
+        atexit.register(self._flush)
+
+    @staticmethod
+    def _default_path(database, db_id: str) -> str:
+        base = getattr(getattr(database, "db", database), "file_name", None)
+        folder = os.path.dirname(os.path.abspath(base)) if base else os.getcwd()
+        return os.path.join(folder, f"{db_id}.analytics.db")
+
+    def record(self, command: str, user_id: int, timestamp: float = None):
+        timestamp = time.time() if timestamp is None else timestamp
+        with self._buffer_lock:
+            for bucket in AnalyticsStore.buckets(timestamp):
+                self._pending[(*bucket, command, user_id)] += 1
+            if self.raw_events:
+                self._events.append((timestamp, command, user_id))
+
+    def _flush(self):
+        with self._buffer_lock:
+            pending, events = self._pending, self._events
+            self._pending, self._events = Counter(), []
+            self._last_flush = time.monotonic()
+        if not (pending or events):
+            return
+        try:
+            self.store.add(pending, events)
+        except Exception:
+            with self._buffer_lock:
+                pending.update(self._pending)
+                self._pending = pending
+                self._events = events + self._events
+            raise
+
+    async def flush(self):
+        await asyncio.to_thread(self._flush)
+
+    def _flush_due(self) -> bool:
+        return len(self._pending) >= self.flush_size or time.monotonic() - self._last_flush >= self.flush_interval
+
+    async def _ensure_migrated(self):
+        if self._migrated:
+            return
+        if self._migrate_lock is None:
+            self._migrate_lock = asyncio.Lock()
+        async with self._migrate_lock:
+            if self._migrated:
+                return
+            marker = f"legacy:{self.db_id}:{self.var_key}"
+            if await asyncio.to_thread(self.store.get_meta, marker) is None:
+                counts, events = Counter(), []
+                cutoff = time.time() - self.store.retention
+                for log in await call_database(self.db, "getListVars", self.db_id, "logs", self.var_key):
+                    if not isinstance(log, dict) or "command" not in log or "user_id" not in log:
+                        continue
+                    timestamp = log.get("timestamp", 0)
+                    for bucket in AnalyticsStore.buckets(timestamp):
+                        counts[(*bucket, log["command"], log["user_id"])] += 1
+                    if self.raw_events and timestamp >= cutoff:
+                        events.append((timestamp, log["command"], log["user_id"]))
+                await asyncio.to_thread(self.store.add, counts, events)
+                await asyncio.to_thread(self.store.set_meta, marker, str(int(time.time())))
+            self._migrated = True
 
     def track_usage(self, func):
         @wraps(func)
         async def wrapped(client, message, *args, **kwargs):
             if isinstance(message, Message) and message.command:
                 user_id_to_log = message.from_user.id if message.from_user else client.me.id
-                log_entry = {
-                    "command": message.command[0],
-                    "user_id": user_id_to_log,
-                    "timestamp": int(time.time()),
-                }
-                self.db.setListVars(self.db_id, "logs", log_entry, var_key=self.var_key)
+                self.record(message.command[0], user_id_to_log)
+                if self._flush_due():
+                    await self._ensure_migrated()
+                    await self.flush()
             return await func(client, message, *args, **kwargs)
 
         return wrapped
 
-    def _get_usage_logs(self) -> List[dict]:
-        return self.db.getListVars(self.db_id, "logs", self.var_key)
-
-    async def get_all_logs(self) -> List[dict]:
-        loop = asyncio.get_running_loop()
-        return await loop.run_in_executor(None, self._get_usage_logs)
+    async def _query(self, method, *args, **kwargs):
+        await self._ensure_migrated()
+        await self.flush()
+        return await asyncio.to_thread(method, *args, **kwargs)
 
-    async def get_top_commands(self, limit: int = 10) -> List[Tuple[str, int]]:
-        logs = await self.get_all_logs()
-        if not logs:
-            return []
+    async def get_all_logs(self, since: float = None) -> List[dict]:
+        if self.raw_events:
+            events = await self._query(self.store.events, since)
+        else:
+            events = [
+                (bucket, command, user_id)
+                for bucket, command, user_id, count in await self._query(self.store.counts, since)
+                for _ in range(count)
+            ]
+        return [{"command": command, "user_id": user_id, "timestamp": int(ts)} for ts, command, user_id in events]
 
-        command_counts = Counter(log["command"] for log in logs if "command" in log)
-        return command_counts.most_common(limit)
+    async def get_top_commands(self, limit: int = 10, since: float = None) -> List[Tuple[str, int]]:
+        return await self._query(self.store.top, "command", limit, since)
 
-    async def get_active_users(self, limit: int = 10) -> List[Tuple[int, int]]:
-        logs = await self.get_all_logs()
-        if not logs:
-            return []
+    async def get_active_users(self, limit: int = 10, since: float = None) -> List[Tuple[int, int]]:
+        return await self._query(self.store.top, "user_id", limit, since)
 
-        user_counts = Counter(log["user_id"] for log in logs if "user_id" in log)
-        return user_counts.most_common(limit)
+    async def get_usage(
+        self, granularity: str = "day", since: float = None, command: str = None, user_id: int = None
+    ) -> List[Tuple[int, int]]:
+        return await self._query(self.store.series, HOUR if granularity == "hour" else DAY, since, command, user_id)
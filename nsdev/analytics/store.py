@@ -0,0 +1,123 @@
+import sqlite3
+import threading
+import time
+
+HOUR = 3600
+DAY = 86400
+
+
+class AnalyticsStore:
+    def __init__(self, path: str = "analytics.db", retention: float = 7 * DAY, purge_interval: float = HOUR):
+        self.path = path
+        self.retention = retention
+        self.purge_interval = purge_interval
+        self._next_purge = 0.0
+        self._lock = threading.Lock()
+        self.conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self.conn.execute("PRAGMA busy_timeout = 5000")
+        self.conn.execute("PRAGMA journal_mode = WAL")
+        self.conn.execute("PRAGMA synchronous = NORMAL")
+        self.conn.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS counters (
+                granularity INTEGER NOT NULL, bucket INTEGER NOT NULL, command TEXT NOT NULL,
+                user_id INTEGER NOT NULL, count INTEGER NOT NULL,
+                PRIMARY KEY (granularity, bucket, command, user_id)
+            ) WITHOUT ROWID;
+            CREATE TABLE IF NOT EXISTS events (ts REAL NOT NULL, command TEXT NOT NULL, user_id INTEGER NOT NULL);
+            CREATE INDEX IF NOT EXISTS idx_events_ts ON events (ts);
+            CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT) WITHOUT ROWID;
+        """
+        )
+
+    @staticmethod
+    def buckets(ts: float):
+        return ((HOUR, int(ts) // HOUR * HOUR), (DAY, int(ts) // DAY * DAY))
+
+    def add(self, counts: dict, events: list = ()):
+        now = time.time()
+        with self._lock:
+            self.conn.execute("BEGIN IMMEDIATE")
+            try:
+                self.conn.executemany(
+                    """
+                    INSERT INTO counters (granularity, bucket, command, user_id, count) VALUES (?, ?, ?, ?, ?)
+                    ON CONFLICT (granularity, bucket, command, user_id) DO UPDATE SET count = count + excluded.count
+                """,
+                    [(*key, count) for key, count in counts.items()],
+                )
+                if events:
+                    self.conn.executemany("INSERT INTO events (ts, command, user_id) VALUES (?, ?, ?)", events)
+                if now >= self._next_purge:
+                    self._purge(now)
+                self.conn.execute("COMMIT")
+            except BaseException:
+                self.conn.execute("ROLLBACK")
+                raise
+
+    def _purge(self, now: float):
+        cutoff = now - self.retention
+        self.conn.execute("DELETE FROM events WHERE ts < ?", (cutoff,))
+        self.conn.execute("DELETE FROM counters WHERE granularity = ? AND bucket < ?", (HOUR, cutoff - HOUR))
+        self._next_purge = now + self.purge_interval
+
+    def _range(self, since: float = None):
+        if since is None:
+            return DAY, 0
+        granularity = HOUR if since >= time.time() - self.retention else DAY
+        return granularity, int(since) // granularity * granularity
+
+    def top(self, column: str, limit: int = 10, since: float = None) -> list:
+        granularity, start = self._range(since)
+        with self._lock:
+            return self.conn.execute(
+                f"""
+                SELECT {column}, SUM(count) AS total FROM counters
+                WHERE granularity = ? AND bucket >= ? GROUP BY {column} ORDER BY total DESC, {column} LIMIT ?
+            """,
+                (granularity, start, limit),
+            ).fetchall()
+
+    def series(self, granularity: int = DAY, since: float = None, command: str = None, user_id: int = None) -> list:
+        query = "SELECT bucket, SUM(count) FROM counters WHERE granularity = ? AND bucket >= ?"
+        params = [granularity, int(since or 0) // granularity * granularity]
+        if command is not None:
+            query += " AND command = ?"
+            params.append(command)
+        if user_id is not None:
+            query += " AND user_id = ?"
+            params.append(user_id)
+        with self._lock:
+            return self.conn.execute(query + " GROUP BY bucket ORDER BY bucket", params).fetchall()
+
+    def counts(self, since: float = None) -> list:
+        cutoff = -(-int(time.time() - self.retention) // DAY) * DAY
+        start = int(since or 0)
+        with self._lock:
+            return self.conn.execute(
+                """
+                SELECT bucket, command, user_id, count FROM counters
+                WHERE (granularity = ? AND bucket < ? AND bucket >= ?)
+                   OR (granularity = ? AND bucket >= ? AND bucket >= ?)
+                ORDER BY bucket
+            """,
+                (DAY, cutoff, start // DAY * DAY, HOUR, cutoff, start // HOUR * HOUR),
+            ).fetchall()
+
+    def events(self, since: float = None) -> list:
+        with self._lock:
+            return self.conn.execute(
+                "SELECT ts, command, user_id FROM events WHERE ts >= ? ORDER BY ts", (since or 0,)
+            ).fetchall()
+
+    def get_meta(self, key: str):
+        with self._lock:
+            row = self.conn.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    def set_meta(self, key: str, value: str):
+        with self._lock:
+            self.conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)", (key, value))
+
+    def close(self):
+        self.conn.close()
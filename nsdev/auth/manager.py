@@ -3,22 +3,22 @@ from typing import List, Union
 
 from pyrogram.types import CallbackQuery, Message
 
-from ..data.database import DataBase
+from ..data.database import AsyncDataBase, DataBase, call_database
 
 
 class AuthManager:
-    def __init__(self, database: DataBase, var_key: str = "auth_roles"):
+    def __init__(self, database: Union[DataBase, AsyncDataBase], var_key: str = "auth_roles"):
         self.db = database
         self.var_key = var_key
 
     async def set_role(self, user_id: int, role: str) -> None:
-        self.db.setListVars(user_id, "roles", role.lower(), var_key=self.var_key)
+        await call_database(self.db, "setListVars", user_id, "roles", role.lower(), var_key=self.var_key)
 
     async def remove_role(self, user_id: int, role: str) -> None:
-        self.db.removeListVars(user_id, "roles", role.lower(), var_key=self.var_key)
+        await call_database(self.db, "removeListVars", user_id, "roles", role.lower(), var_key=self.var_key)
 
     async def get_roles(self, user_id: int) -> List[str]:
-        return self.db.getListVars(user_id, "roles", var_key=self.var_key)
+        return await call_database(self.db, "getListVars", user_id, "roles", var_key=self.var_key)
 
     def requires_role(self, required_roles: Union[str, List[str]]):
         if isinstance(required_roles, str):
@@ -1,10 +1,184 @@
 import base64
 import binascii
+import functools
+import hashlib
+import hmac
 import json
+import marshal
+import operator
+import os
+import sys
+import threading
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from contextlib import contextmanager
+from itertools import cycle
 
 from ..utils.colorize import AnsiColors
 from ..utils.logger import LoggerHandler
 
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+_NUMPY_MIN_BYTES = 1024
+_OFFSET_CACHE_MAX_BYTES = 1024 * 1024
+_COMPACT_PREFIX = "~1"
+_AESGCM_PREFIX = "~g"
+_AESGCM_SALT = b"nsdev.CipherHandler.aesgcm"
+_AESGCM_ITERATIONS = 200_000
+_STREAM_MAGIC = b"NSE1"
+_AEAD_STREAM_MAGIC = b"NSG1"
+_STREAM_CHUNK_SIZE = 1024 * 1024
+_PARALLEL_MIN_CHARS = 4 * 1024 * 1024
+_JSON_START = frozenset('{["-0123456789tfnNI \t\n\r')
+_LOADER_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "nsdev", "loaders")
+
+_process_pool = None
+_process_pool_lock = threading.Lock()
+
+
+class _LookupTable(dict):
+    def __init__(self, fallback, keys):
+        super().__init__((key, fallback(key)) for key in keys)
+        self.fallback = fallback
+
+    def __missing__(self, key):
+        return self.fallback(key)
+
+
+_HEX_CODES = _LookupTable(hex, range(0x300))
+_HEX_VALUES = _LookupTable(lambda code: int(code, 16), _HEX_CODES.values())
+
+
+def _loads_json(text):
+    if isinstance(text, str) and text and text[0] in _JSON_START:
+        try:
+            return json.loads(text)
+        except json.JSONDecodeError:
+            pass
+    return text
+
+
+@functools.lru_cache(maxsize=8)
+def _pool_handler(kind, options):
+    options = dict(options)
+    return CipherHandler(**options) if kind == "cipher" else AsciiManager(options["key"])
+
+
+def _pool_task(kind, options, method, values, kwargs):
+    return getattr(_pool_handler(kind, options), method)(values, workers=1, **dict(kwargs))
+
+
+def _map_parallel(spec, method, values, workers, **kwargs):
+    global _process_pool
+    size = -(-len(values) // workers)
+    chunks = [values[i : i + size] for i in range(0, len(values), size)]
+    try:
+        with _process_pool_lock:
+            if _process_pool is None:
+                _process_pool = ProcessPoolExecutor()
+            pool = _process_pool
+        futures = [pool.submit(_pool_task, *spec, method, chunk, tuple(kwargs.items())) for chunk in chunks]
+        return [item for future in futures for item in future.result()]
+    except (OSError, NotImplementedError, BrokenProcessPool):
+        with _process_pool_lock:
+            _process_pool = None
+        return None
+
+
+def _use_parallel(values, workers, threshold):
+    if (
+        not workers
+        or workers < 2
+        or len(values) < 2
+        or sum(len(v) for v in values if isinstance(v, (str, list))) < threshold
+    ):
+        return 0
+    return min(workers, len(values))
+
+
+def _run_code(payload: bytes, key: str, decode, seal, scope: dict, cache):
+    if not cache:
+        exec(compile(decode(payload), "<string>", "exec"), scope)
+        return
+
+    cache_dir = cache if isinstance(cache, (str, os.PathLike)) else _LOADER_CACHE_DIR
+    digest = hashlib.sha256(payload + key.encode("utf-8")).hexdigest()
+    path = os.path.join(cache_dir, f"{digest}.{sys.implementation.cache_tag}.bin")
+    try:
+        with open(path, "rb") as f:
+            code = marshal.loads(seal(f.read()))
+    except (OSError, ValueError, EOFError, TypeError):
+        code = compile(decode(payload), "<string>", "exec")
+        try:
+            os.makedirs(cache_dir, exist_ok=True)
+            temp_path = f"{path}.{os.getpid()}.tmp"
+            with open(temp_path, "wb") as f:
+                f.write(seal(marshal.dumps(code)))
+            os.replace(temp_path, path)
+        except OSError:
+            pass
+    exec(code, scope)
+
+
+def _pack_codes(codes) -> bytes:
+    packed = array("I", codes)
+    if sys.byteorder == "big":
+        packed.byteswap()
+    return packed.tobytes()
+
+
+def _unpack_codes(raw: bytes) -> array:
+    codes = array("I")
+    codes.frombytes(raw)
+    if sys.byteorder == "big":
+        codes.byteswap()
+    return codes
+
+
+def _ascii_offsets(key: str, size_class: int) -> array:
+    length = len(key)
+    key_codes = [ord(char) for char in key]
+    if numpy is not None:
+        offsets = numpy.arange(1, size_class + 1, dtype=numpy.uint32) * length + numpy.resize(key_codes, size_class)
+        return array("I", offsets.astype(numpy.uint32).tobytes())
+    return array("I", map(operator.add, range(length, length * (size_class + 1), length), cycle(key_codes)))
+
+
+_cached_ascii_offsets = functools.lru_cache(maxsize=64)(_ascii_offsets)
+
+
+def _fast_loader(class_name: str, key_expression: str, payload: bytes, cache) -> str:
+    hex_map = {
+        alias: name.encode("utf-8").hex()
+        for alias, name in (
+            ("n", "nsdev"),
+            ("C", class_name),
+            ("r", "run_blob"),
+            ("g", "globals"),
+            ("K", key_expression),
+        )
+    }
+    blob = base64.b64encode(payload).decode("ascii")
+    return (
+        "(lambda d, h, x: getattr(getattr(__import__(x(h['n'])), x(h['C']))(**eval(x(h['K']))), x(h['r']))"
+        f"(d, eval(x(h['g']))(), {cache!r}))('{blob}', {hex_map}, lambda s: bytes.fromhex(s).decode('utf-8'))"
+    )
+
+
+@functools.lru_cache(maxsize=32)
+def _derive_aesgcm_keys(key: str):
+    try:
+        from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+    except ImportError:
+        raise ImportError("method='aesgcm' membutuhkan paket 'cryptography': pip install cryptography")
+
+    material = hashlib.pbkdf2_hmac("sha256", key.encode("utf-8"), _AESGCM_SALT, _AESGCM_ITERATIONS, dklen=64)
+    return AESGCM(material[:32]), material[32:]
+
 
 class CipherHandler:
     """
@@ -14,6 +188,10 @@ class CipherHandler:
         - method (str): Metode enkripsi/dekripsi. Pilihan: 'shift', 'bytes', 'binary', Default: shift.
         - key (str | list | int | float): Kunci untuk proses enkripsi/dekripsi. Default: 'my_s3cr3t_k3y_@2024!'.
         - delimiter (str): Delimiter yang digunakan dalam pemisahan data terenkripsi. Default: '|'.
+        - compact (bool): Simpan hasil enkripsi dalam format ringkas ('~1' + base64). Default: False.
+        - legacy_method (str): Metode untuk membaca data lama tanpa prefix saat method='aesgcm'. Default: bytes.
+        - max_workers (int): Jumlah proses untuk encrypt_many/decrypt_many. Default: None (serial, tanpa process pool).
+        - parallel_threshold (int): Total karakter minimum sebelum batch dibagi ke process pool. Default: 4 MiB.
     """
 
     def __init__(self, **options):
@@ -21,9 +199,21 @@ class CipherHandler:
         self.key = self._normalize_key(options.get("key", "my_s3cr3t_k3y_@2024!"))
         self.numeric_key = self._get_numeric_key()
         self.delimiter = options.get("delimiter", "|")
+        self.compact = options.get("compact", False)
+        self.legacy_method = options.get("legacy_method", "bytes")
+        self.max_workers = options.get("max_workers")
+        self.parallel_threshold = options.get("parallel_threshold", _PARALLEL_MIN_CHARS)
 
         if not self.key:
             raise ValueError("Key cannot be empty.")
+        if self.method == "aesgcm":
+            _derive_aesgcm_keys(self.key)
+
+        self._key_bytes = self.key.encode("utf-8")
+        self._key_codes = [ord(char) for char in self.key]
+        self._binary_key = int(self.numeric_key) % 256
+        self._binary_table = _LookupTable(lambda code: format(code ^ self._binary_key, "08b"), range(256))
+        self._binary_xor = bytes(code ^ self._binary_key for code in range(256))
 
         self.log = LoggerHandler()
 
@@ -51,11 +241,30 @@ class CipherHandler:
         except Exception as e:
             raise Exception(f"Offset calculation failed at index {index}: {e}")
 
-    def _xor_encrypt_decrypt(self, data: bytes) -> bytes:
-        key_bytes = self.key.encode("utf-8")
+    def _xor_encrypt_decrypt(self, data: bytes, offset: int = 0) -> bytes:
         if isinstance(data, str):
             data = data.encode("utf-8")
-        return bytes([data[i] ^ key_bytes[i % len(key_bytes)] for i in range(len(data))])
+        size = len(data)
+        offset %= len(self._key_bytes)
+        key = self._key_bytes[offset:] + self._key_bytes[:offset] if offset else self._key_bytes
+        return self._xor_with_stream(data, key * (size // len(key) + 1))
+
+    def _xor_with_stream(self, data: bytes, key_stream: bytes) -> bytes:
+        size = len(data)
+        if numpy is not None and size >= _NUMPY_MIN_BYTES:
+            stream = numpy.frombuffer(key_stream, dtype=numpy.uint8, count=size)
+            return (numpy.frombuffer(data, dtype=numpy.uint8) ^ stream).tobytes()
+        return (int.from_bytes(data, "little") ^ int.from_bytes(key_stream[:size], "little")).to_bytes(size, "little")
+
+    def _xor_many(self, chunks: list) -> list:
+        sizes = list(map(len, chunks))
+        key_stream = self._key_bytes * (max(sizes, default=0) // len(self._key_bytes) + 1)
+        mixed = self._xor_with_stream(b"".join(chunks), b"".join([key_stream[:size] for size in sizes]))
+        result, position = [], 0
+        for size in sizes:
+            result.append(mixed[position : position + size])
+            position += size
+        return result
 
     def _base64_encode(self, data: str) -> str:
         encoded_bytes = base64.b64encode(data.encode("utf-8"))
@@ -74,29 +283,82 @@ class CipherHandler:
         if only_base64:
             return self._base64_decode(encrypted_data)
 
-        decrypted_string = ""
-        if self.method == "bytes":
-            decrypted_string = self.decrypt_bytes(encrypted_data)
-        elif self.method == "binary":
-            decrypted_string = self.decrypt_binary(encrypted_data)
-        elif self.method == "shift":
-            decrypted_string = self.decrypt_shift(encrypted_data)
+        return _loads_json(self.decrypt_text(encrypted_data))
+
+    def _pool_spec(self):
+        options = (
+            ("key", self.key),
+            ("method", self.method),
+            ("delimiter", self.delimiter),
+            ("compact", self.compact),
+            ("legacy_method", self.legacy_method),
+        )
+        return "cipher", options
+
+    def decrypt_many(self, encrypted_values, parse_json: bool = True, workers: int = None) -> list:
+        encrypted_values = list(encrypted_values)
+        workers = _use_parallel(encrypted_values, workers or self.max_workers, self.parallel_threshold)
+        if workers:
+            result = _map_parallel(self._pool_spec(), "decrypt_many", encrypted_values, workers, parse_json=parse_json)
+            if result is not None:
+                return result
+
+        decrypted = self._decrypt_texts(encrypted_values)
+        return list(map(_loads_json, decrypted)) if parse_json else decrypted
+
+    def _decrypt_texts(self, encrypted_values: list) -> list:
+        hex_method = (self.legacy_method if self.method == "aesgcm" else self.method) == "bytes"
+        result = [None] * len(encrypted_values)
+        indexes, chunks = [], []
+        try:
+            for index, value in enumerate(encrypted_values):
+                if value.startswith(_COMPACT_PREFIX):
+                    payload = value[len(_COMPACT_PREFIX) :]
+                    chunks.append(base64.b64decode(payload + "=" * (-len(payload) % 4), validate=True))
+                elif hex_method and not value.startswith(_AESGCM_PREFIX):
+                    chunks.append(bytes.fromhex(value))
+                else:
+                    result[index] = self.decrypt_text(value)
+                    continue
+                indexes.append(index)
+            for index, raw in zip(indexes, self._xor_many(chunks)):
+                result[index] = raw.decode("utf-8")
+        except (AttributeError, binascii.Error, UnicodeDecodeError, ValueError):
+            return list(map(self.decrypt_text, encrypted_values))
+        return result
+
+    def decrypt_text(self, encrypted_data: str) -> str:
+        method = self.legacy_method if self.method == "aesgcm" else self.method
+        if isinstance(encrypted_data, str) and encrypted_data.startswith(_AESGCM_PREFIX):
+            return self.decrypt_aesgcm(encrypted_data)
+        elif isinstance(encrypted_data, str) and encrypted_data.startswith(_COMPACT_PREFIX):
+            return self.decrypt_compact(encrypted_data)
+        elif method == "bytes":
+            return self.decrypt_bytes(encrypted_data)
+        elif method == "binary":
+            return self.decrypt_binary(encrypted_data)
+        elif method == "shift":
+            return self.decrypt_shift(encrypted_data)
         else:
-            raise ValueError(f"Metode dekripsi '{self.method}' tidak dikenali.")
+            raise ValueError(f"Metode dekripsi '{method}' tidak dikenali.")
+
+    def decrypt_aesgcm(self, encrypted_data: str) -> str:
+        from cryptography.exceptions import InvalidTag
 
+        aesgcm, _ = _derive_aesgcm_keys(self.key)
         try:
-            return json.loads(decrypted_string)
-        except (json.JSONDecodeError, TypeError):
-            return decrypted_string
+            payload = encrypted_data[len(_AESGCM_PREFIX) :]
+            raw = base64.b64decode(payload + "=" * (-len(payload) % 4), validate=True)
+            return aesgcm.decrypt(raw[:12], raw[12:], None).decode("utf-8")
+        except (binascii.Error, InvalidTag, UnicodeDecodeError) as e:
+            raise ValueError(f"Decryption failed for 'aesgcm' method: {str(e) or 'authentication tag mismatch'}")
 
     def decrypt_binary(self, encrypted_bits: str) -> str:
-        if not encrypted_bits or len(encrypted_bits) % 8 != 0:
+        size = len(encrypted_bits)
+        if not size or size % 8 != 0 or encrypted_bits.count("0") + encrypted_bits.count("1") != size:
             raise ValueError("Data biner yang dienkripsi tidak valid atau kosong.")
-        decrypted_chars = [
-            chr(int(encrypted_bits[i : i + 8], 2) ^ int(self.numeric_key) % 256)
-            for i in range(0, len(encrypted_bits), 8)
-        ]
-        return "".join(decrypted_chars)
+        raw = int(encrypted_bits, 2).to_bytes(size // 8, "big")
+        return raw.translate(self._binary_xor).decode("latin-1")
 
     def decrypt_bytes(self, encrypted_data: str) -> str:
         try:
@@ -106,14 +368,22 @@ class CipherHandler:
         except Exception as e:
             raise Exception(f"Decryption failed for 'bytes' method: {e}")
 
+    def decrypt_compact(self, encrypted_data: str) -> str:
+        try:
+            payload = encrypted_data[len(_COMPACT_PREFIX) :]
+            raw = base64.b64decode(payload + "=" * (-len(payload) % 4), validate=True)
+            return self._xor_encrypt_decrypt(raw).decode("utf-8")
+        except (binascii.Error, UnicodeDecodeError) as e:
+            raise ValueError(f"Decryption failed for compact format: {e}")
+
     def decrypt_shift(self, encoded_text: str) -> str:
         try:
-            codes = encoded_text.split(self.delimiter)
-            return "".join(chr(int(code, 16) - ord(self.key[i % len(self.key)])) for i, code in enumerate(codes))
+            codes = map(_HEX_VALUES.__getitem__, encoded_text.split(self.delimiter))
+            return "".join(map(chr, map(operator.sub, codes, cycle(self._key_codes))))
         except (ValueError, TypeError) as error:
             raise ValueError(f"Error during shift decryption: {error}")
 
-    def encrypt(self, data, only_base64: bool = False) -> str:
+    def encrypt(self, data, only_base64: bool = False, compact: bool = None) -> str:
         if only_base64:
             return self._base64_encode(data)
 
@@ -122,19 +392,71 @@ class CipherHandler:
         else:
             message_to_encrypt = data
 
-        if self.method == "bytes":
-            return self.encrypt_bytes(message_to_encrypt)
+        return self._encoder(compact)(message_to_encrypt)
+
+    def _encoder(self, compact: bool = None):
+        if self.method == "aesgcm":
+            return self.encrypt_aesgcm
+        elif self.compact if compact is None else compact:
+            return self.encrypt_compact
+        elif self.method == "bytes":
+            return self.encrypt_bytes
         elif self.method == "binary":
-            return self.encrypt_binary(message_to_encrypt)
+            return self.encrypt_binary
         elif self.method == "shift":
-            return self.encrypt_shift(message_to_encrypt)
+            return self.encrypt_shift
         else:
             raise ValueError(f"Metode enkripsi '{self.method}' tidak dikenali.")
 
+    def encrypt_many(self, values, compact: bool = None, workers: int = None) -> list:
+        messages = [value if isinstance(value, str) else json.dumps(value, separators=(",", ":")) for value in values]
+        encode = self._encoder(compact)
+        workers = _use_parallel(messages, workers or self.max_workers, self.parallel_threshold)
+        if workers:
+            result = _map_parallel(self._pool_spec(), "encrypt_many", messages, workers, compact=compact)
+            if result is not None:
+                return result
+        if encode == self.encrypt_bytes:
+            return [raw.hex() for raw in self._xor_many([message.encode("utf-8") for message in messages])]
+        elif encode == self.encrypt_compact:
+            return [
+                _COMPACT_PREFIX + base64.b64encode(raw).decode("ascii").rstrip("=")
+                for raw in self._xor_many([message.encode("utf-8") for message in messages])
+            ]
+        return list(map(encode, messages))
+
+    def encrypt_aesgcm(self, message: str) -> str:
+        aesgcm, nonce_key = _derive_aesgcm_keys(self.key)
+        plaintext = message.encode("utf-8")
+        nonce = hmac.new(nonce_key, plaintext, hashlib.sha256).digest()[:12]
+        sealed = nonce + aesgcm.encrypt(nonce, plaintext, None)
+        return _AESGCM_PREFIX + base64.b64encode(sealed).decode("ascii").rstrip("=")
+
+    def encrypt_aliases(self, data) -> tuple:
+        if self.method != "aesgcm":
+            return (self.encrypt(data, compact=not self.compact),)
+        return self._legacy_cipher.encrypt(data, compact=False), self._legacy_cipher.encrypt(data, compact=True)
+
+    @functools.cached_property
+    def _legacy_cipher(self):
+        return CipherHandler(key=self.key, method=self.legacy_method, delimiter=self.delimiter)
+
+    def needs_migration(self, encrypted_data) -> bool:
+        return (
+            self.method == "aesgcm"
+            and isinstance(encrypted_data, str)
+            and not encrypted_data.startswith(_AESGCM_PREFIX)
+        )
+
+    def reencrypt(self, encrypted_data: str) -> str:
+        return self.encrypt(self.decrypt_text(encrypted_data))
+
     def encrypt_binary(self, plaintext: str) -> str:
-        xor_key = int(self.numeric_key) % 256
-        encrypted_bits = "".join(format(ord(char) ^ xor_key, "08b") for char in plaintext)
-        return encrypted_bits
+        try:
+            raw = plaintext.encode("latin-1").translate(self._binary_xor)
+        except UnicodeEncodeError:
+            return plaintext.translate(self._binary_table)
+        return format(int.from_bytes(raw, "big"), f"0{len(raw) * 8}b") if raw else ""
 
     def encrypt_bytes(self, message: str) -> str:
         try:
@@ -143,11 +465,60 @@ class CipherHandler:
         except Exception as e:
             raise Exception(f"Encryption failed for 'bytes' method: {e}")
 
+    def encrypt_compact(self, message: str) -> str:
+        encrypted_bytes = self._xor_encrypt_decrypt(message.encode("utf-8"))
+        return _COMPACT_PREFIX + base64.b64encode(encrypted_bytes).decode("ascii").rstrip("=")
+
     def encrypt_shift(self, text: str) -> str:
-        encoded_hex = [hex(ord(text[i]) + ord(self.key[i % len(self.key)])) for i in range(len(text))]
-        return self.delimiter.join(encoded_hex)
+        return self.delimiter.join(
+            map(_HEX_CODES.__getitem__, map(operator.add, map(ord, text), cycle(self._key_codes)))
+        )
+
+    def encryptor(self, target=None):
+        if self.method == "aesgcm":
+            return AeadEncryptor(self, target)
+        return Encryptor(self, target)
+
+    def decryptor(self, target=None):
+        if self.method == "aesgcm":
+            return AeadDecryptor(self, target)
+        return Decryptor(self, target)
+
+    def _stream_file(self, stream, src, dst, chunk_size):
+        with _open_binary(src, "rb") as source, _open_binary(dst, "wb") as target:
+            stream.target = target
+            for chunk in iter(lambda: source.read(chunk_size), b""):
+                stream.write(chunk)
+            stream.close()
+
+    def encrypt_file(self, src, dst, chunk_size: int = _STREAM_CHUNK_SIZE):
+        self._stream_file(self.encryptor(), src, dst, chunk_size)
+
+    def decrypt_file(self, src, dst, chunk_size: int = _STREAM_CHUNK_SIZE):
+        self._stream_file(self.decryptor(), src, dst, chunk_size)
+
+    def run_blob(self, blob: str, scope: dict, cache=False):
+        _run_code(
+            base64.b64decode(blob),
+            self.key,
+            lambda payload: self._xor_encrypt_decrypt(payload).decode("utf-8"),
+            self._xor_encrypt_decrypt,
+            scope,
+            cache,
+        )
+
+    def save(self, filename: str, code: str, key_by_config: str = None, fast: bool = False, cache=False):
+        if fast:
+            key_expression = key_by_config if key_by_config is not None else repr(self.key)
+            payload = self._xor_encrypt_decrypt(code.encode("utf-8"))
+            try:
+                with open(filename, "w") as file:
+                    file.write(_fast_loader("CipherHandler", f"{{'key': {key_expression}}}", payload, cache))
+                self.log.info(f"Kode berhasil disimpan ke file {filename}")
+            except Exception as e:
+                raise IOError(f"Saving file failed: {e}")
+            return
 
-    def save(self, filename: str, code: str, key_by_config: str = None):
         encrypted_code = self.encrypt(code)
         if encrypted_code is None:
             raise ValueError("Encryption failed, cannot save.")
@@ -184,6 +555,193 @@ class CipherHandler:
             raise IOError(f"Saving file failed: {e}")
 
 
+@contextmanager
+def _open_binary(file, mode):
+    if not isinstance(file, (str, bytes, os.PathLike)):
+        yield file
+        return
+    with open(file, mode) as handle:
+        yield handle
+
+
+class _KeyStream:
+    def __init__(self, cipher: CipherHandler, target=None):
+        self.cipher = cipher
+        self.target = target
+        self.position = 0
+
+    def _transform(self, chunk: bytes) -> bytes:
+        result = self.cipher._xor_encrypt_decrypt(chunk, self.position)
+        self.position += len(chunk)
+        return result
+
+    def write(self, data) -> int:
+        if self.target is None:
+            raise ValueError("Stream has no target to write to.")
+        self.target.write(self.update(data))
+        return len(data)
+
+    def flush(self):
+        if self.target is not None:
+            self.target.flush()
+
+    def close(self):
+        tail = self.finalize()
+        if self.target is not None:
+            self.target.write(tail)
+            self.target.flush()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, *exc_info):
+        if exc_type is None:
+            self.close()
+
+
+class Encryptor(_KeyStream):
+    def __init__(self, cipher: CipherHandler, target=None):
+        super().__init__(cipher, target)
+        self._header_sent = False
+
+    def _take_header(self) -> bytes:
+        if self._header_sent:
+            return b""
+        self._header_sent = True
+        return _STREAM_MAGIC
+
+    def update(self, chunk: bytes) -> bytes:
+        header = self._take_header()
+        return header + self._transform(bytes(chunk)) if chunk else header
+
+    def finalize(self) -> bytes:
+        return self._take_header()
+
+
+class Decryptor(_KeyStream):
+    def __init__(self, cipher: CipherHandler, target=None):
+        super().__init__(cipher, target)
+        self._header = b""
+
+    def update(self, chunk: bytes) -> bytes:
+        chunk = bytes(chunk)
+        if len(self._header) < len(_STREAM_MAGIC):
+            needed = len(_STREAM_MAGIC) - len(self._header)
+            self._header += chunk[:needed]
+            chunk = chunk[needed:]
+            if not _STREAM_MAGIC.startswith(self._header):
+                raise ValueError("Data is not an encrypted stream produced by Encryptor.")
+        return self._transform(chunk) if chunk else b""
+
+    def finalize(self) -> bytes:
+        if self._header != _STREAM_MAGIC:
+            raise ValueError("Encrypted stream is truncated.")
+        return b""
+
+
+class AeadEncryptor(_KeyStream):
+    def __init__(self, cipher: CipherHandler, target=None, chunk_size: int = _STREAM_CHUNK_SIZE):
+        super().__init__(cipher, target)
+        self.chunk_size = chunk_size
+        self._aesgcm, _ = _derive_aesgcm_keys(cipher.key)
+        self._prefix = os.urandom(7)
+        self._buffer = bytearray()
+        self._header_sent = False
+        self._finished = False
+
+    def _seal(self, chunk: bytes, last: bool) -> bytes:
+        nonce = self._prefix + self.position.to_bytes(4, "big") + bytes((last,))
+        self.position += 1
+        sealed = self._aesgcm.encrypt(nonce, chunk, None)
+        return (len(sealed) | (last << 31)).to_bytes(4, "big") + sealed
+
+    def _take_header(self) -> bytes:
+        if self._header_sent:
+            return b""
+        self._header_sent = True
+        return _AEAD_STREAM_MAGIC + self._prefix
+
+    def update(self, chunk: bytes) -> bytes:
+        if self._finished:
+            raise ValueError("Stream has already been finalized.")
+        self._buffer += chunk
+        frames = [self._take_header()]
+        while len(self._buffer) > self.chunk_size:
+            frames.append(self._seal(bytes(self._buffer[: self.chunk_size]), False))
+            del self._buffer[: self.chunk_size]
+        return b"".join(frames)
+
+    def finalize(self) -> bytes:
+        if self._finished:
+            return b""
+        self._finished = True
+        tail = self._take_header() + self._seal(bytes(self._buffer), True)
+        self._buffer.clear()
+        return tail
+
+
+class AeadDecryptor(_KeyStream):
+    def __init__(self, cipher: CipherHandler, target=None):
+        super().__init__(cipher, target)
+        self._aesgcm, _ = _derive_aesgcm_keys(cipher.key)
+        self._buffer = bytearray()
+        self._prefix = None
+        self._legacy = None
+        self._finished = False
+
+    def update(self, chunk: bytes) -> bytes:
+        if self._legacy is not None:
+            return self._legacy.update(chunk)
+        if self._finished:
+            if chunk:
+                raise ValueError("Unexpected data after the end of the encrypted stream.")
+            return b""
+        self._buffer += chunk
+        if self._prefix is None:
+            if self._buffer[:4] == _STREAM_MAGIC:
+                self._legacy = Decryptor(self.cipher)
+                data = bytes(self._buffer)
+                self._buffer.clear()
+                return self._legacy.update(data)
+            if len(self._buffer) < 11:
+                if not any(magic.startswith(bytes(self._buffer[:4])) for magic in (_AEAD_STREAM_MAGIC, _STREAM_MAGIC)):
+                    raise ValueError("Data is not an encrypted stream produced by Encryptor.")
+                return b""
+            if self._buffer[:4] != _AEAD_STREAM_MAGIC:
+                raise ValueError("Data is not an encrypted stream produced by Encryptor.")
+            self._prefix = bytes(self._buffer[4:11])
+            del self._buffer[:11]
+
+        from cryptography.exceptions import InvalidTag
+
+        plain = []
+        while len(self._buffer) >= 4:
+            header = int.from_bytes(self._buffer[:4], "big")
+            size, last = header & 0x7FFFFFFF, header >> 31
+            if len(self._buffer) < 4 + size:
+                break
+            nonce = self._prefix + self.position.to_bytes(4, "big") + bytes((last,))
+            try:
+                plain.append(self._aesgcm.decrypt(nonce, bytes(self._buffer[4 : 4 + size]), None))
+            except InvalidTag:
+                raise ValueError("Encrypted stream failed authentication (corrupted, reordered or wrong key).")
+            self.position += 1
+            del self._buffer[: 4 + size]
+            if last:
+                self._finished = True
+                if self._buffer:
+                    raise ValueError("Unexpected data after the end of the encrypted stream.")
+                break
+        return b"".join(plain)
+
+    def finalize(self) -> bytes:
+        if self._legacy is not None:
+            return self._legacy.finalize()
+        if not self._finished:
+            raise ValueError("Encrypted stream is truncated.")
+        return b""
+
+
 class AsciiManager(AnsiColors):
     def __init__(self, key):
         super().__init__()
@@ -210,19 +768,90 @@ class AsciiManager(AnsiColors):
         except Exception as e:
             raise Exception(f"Offset calculation failed at index {index}: {e}")
 
+    def _offset_table(self, size: int) -> array:
+        size_class = max(64, 1 << (size - 1).bit_length())
+        if size_class * 4 > _OFFSET_CACHE_MAX_BYTES:
+            return _ascii_offsets(self.key, size)
+        return _cached_ascii_offsets(self.key, size_class)
+
+    def _encode(self, message: str) -> array:
+        offsets = self._offset_table(len(message))
+        if numpy is not None and len(message) >= _NUMPY_MIN_BYTES:
+            try:
+                chars = numpy.frombuffer(message.encode("utf-32-le"), dtype="<u4")
+            except UnicodeEncodeError:
+                pass
+            else:
+                codes = chars.astype(numpy.uint32) + numpy.frombuffer(offsets, dtype=numpy.uint32, count=len(message))
+                return array("I", codes.tobytes())
+        return array("I", map(operator.add, map(ord, message), offsets))
+
+    def _decode(self, codes) -> str:
+        if isinstance(codes, memoryview) and codes.format != "I":
+            codes = _unpack_codes(codes)
+        elif not isinstance(codes, (array, memoryview)):
+            codes = array("I", map(int, codes))
+        size = len(codes)
+        offsets = self._offset_table(size)
+        if numpy is not None and size >= _NUMPY_MIN_BYTES:
+            plain = numpy.frombuffer(codes, dtype=numpy.uint32) - numpy.frombuffer(
+                offsets, dtype=numpy.uint32, count=size
+            )
+            try:
+                return plain.astype("<u4").tobytes().decode("utf-32-le")
+            except UnicodeDecodeError:
+                pass
+        return "".join(map(chr, map(operator.sub, codes, offsets)))
+
+    def to_bytes(self, codes) -> bytes:
+        return _pack_codes(codes)
+
+    def from_bytes(self, raw: bytes) -> array:
+        return _unpack_codes(raw)
+
+    def encrypt_many(self, values, workers: int = None) -> list:
+        try:
+            messages = [v if isinstance(v, str) else json.dumps(v, separators=(",", ":")) for v in values]
+            workers = _use_parallel(messages, workers, _PARALLEL_MIN_CHARS)
+            if workers:
+                result = _map_parallel(("ascii", (("key", self.key),)), "encrypt_many", messages, workers)
+                if result is not None:
+                    return result
+            return [self._encode(message).tolist() for message in messages]
+        except Exception as e:
+            raise Exception(f"Encryption failed: {e}")
+
+    def decrypt_many(self, values, parse_json: bool = True, workers: int = None) -> list:
+        try:
+            values = list(values)
+            workers = _use_parallel(values, workers, _PARALLEL_MIN_CHARS)
+            if workers:
+                result = _map_parallel(
+                    ("ascii", (("key", self.key),)), "decrypt_many", values, workers, parse_json=parse_json
+                )
+                if result is not None:
+                    return result
+            decrypted = list(map(self._decode, values))
+            return list(map(_loads_json, decrypted)) if parse_json else decrypted
+        except Exception as e:
+            raise Exception(f"Decryption failed: {e}")
+
     def encrypt(self, data) -> list[int]:
+        return self.encrypt_array(data).tolist()
+
+    def encrypt_array(self, data) -> array:
         try:
             if not isinstance(data, str):
                 message = json.dumps(data, separators=(",", ":"))
             else:
                 message = data
-            return [int(ord(char) + self._offset(i)) for i, char in enumerate(message)]
+            return self._encode(message)
         except Exception as e:
             raise Exception(f"Encryption failed: {e}")
 
-    def decrypt(self, encrypted: list[int]):
+    def decrypt(self, encrypted):
         try:
-            decrypted_string = "".join(chr(int(code) - self._offset(i)) for i, code in enumerate(encrypted))
+            decrypted_string = self._decode(encrypted)
             try:
                 return json.loads(decrypted_string)
             except (json.JSONDecodeError, TypeError):
@@ -230,8 +859,29 @@ class AsciiManager(AnsiColors):
         except Exception as e:
             raise Exception(f"Decryption failed: {e}")
 
-    def save_data(self, filename: str, code: str, key_by_config: str = None):
+    def run_blob(self, blob: str, scope: dict, cache=False):
+        _run_code(base64.b64decode(blob), self.key, self._decode_packed, self._seal, scope, cache)
+
+    def _decode_packed(self, payload: bytes) -> str:
+        return self._decode(_unpack_codes(payload))
+
+    def _seal(self, data: bytes) -> bytes:
+        key = self.key.encode("utf-8")
+        stream = key * (len(data) // len(key) + 1)
+        return (int.from_bytes(data, "little") ^ int.from_bytes(stream[: len(data)], "little")).to_bytes(
+            len(data), "little"
+        )
+
+    def save_data(self, filename: str, code: str, key_by_config: str = None, fast: bool = False, cache=False):
         try:
+            if fast:
+                key_expression = key_by_config if key_by_config is not None else repr(self.no_format_key)
+                payload = _pack_codes(self.encrypt_array(code))
+                with open(filename, "w") as file:
+                    file.write(_fast_loader("AsciiManager", f"{{'key': {key_expression}}}", payload, cache))
+                    print(f"{self.GREEN}Kode berhasil disimpan ke file {filename}{self.RESET}")
+                return
+
             encrypted_code = self.encrypt(code)
 
             to_hex = lambda s: s.encode("utf-8").hex()
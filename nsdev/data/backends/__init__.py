@@ -0,0 +1,27 @@
+from .base import StorageBackend
+from .journal import JournalBackend
+from .local import LocalBackend
+from .mongo import MongoBackend
+from .redis import RedisBackend
+from .sqlite import SQLiteBackend
+
+BACKENDS = {
+    backend.name: backend for backend in (LocalBackend, JournalBackend, SQLiteBackend, MongoBackend, RedisBackend)
+}
+
+
+def register_backend(backend: type):
+    BACKENDS[backend.name] = backend
+    return backend
+
+
+__all__ = [
+    "BACKENDS",
+    "JournalBackend",
+    "LocalBackend",
+    "MongoBackend",
+    "RedisBackend",
+    "SQLiteBackend",
+    "StorageBackend",
+    "register_backend",
+]
@@ -0,0 +1,78 @@
+import threading
+from contextlib import contextmanager
+
+
+class StorageBackend:
+    name = None
+    supports_backup = False
+
+    def __init__(self, cipher, **options):
+        self.file_name = options.get("file_name", "database")
+        self.cipher = cipher
+        self._lock = threading.RLock()
+
+    @property
+    def in_transaction(self) -> bool:
+        return False
+
+    @contextmanager
+    def transaction(self):
+        with self._lock:
+            yield
+
+    @contextmanager
+    def backup_files(self):
+        yield {}
+
+    def change_counter(self):
+        return None
+
+    def flush(self):
+        pass
+
+    def close(self):
+        pass
+
+    def get_user(self, user_id: str, var_key: str = None) -> dict:
+        raise NotImplementedError
+
+    def get_var(self, user_id: str, var_key: str, query_name: str):
+        return self.get_user(user_id, var_key).get(var_key, {}).get(query_name)
+
+    def get_list(self, user_id: str, var_key: str, query_name: str) -> list:
+        values = self.get_user(user_id, var_key).get(var_key, {}).get(query_name)
+        return values if isinstance(values, list) else []
+
+    def get_users(self, user_ids: list, var_key: str) -> dict:
+        return {user_id: self.get_user(user_id, var_key).get(var_key, {}) for user_id in user_ids}
+
+    def get_vars_many(self, user_ids: list, var_key: str, query_name: str) -> dict:
+        return {user_id: group.get(query_name) for user_id, group in self.get_users(user_ids, var_key).items()}
+
+    def set_var(self, user_id: str, var_key: str, query_name: str, value: str):
+        raise NotImplementedError
+
+    def set_vars_many(self, var_key: str, query_name: str, values: dict):
+        for user_id, value in values.items():
+            self.set_var(user_id, var_key, query_name, value)
+
+    def remove_var(self, user_id: str, var_key: str, query_name: str):
+        raise NotImplementedError
+
+    def add_list_var(self, user_id: str, var_key: str, query_name: str, value: str, aliases: tuple = ()):
+        raise NotImplementedError
+
+    def remove_list_var(self, user_id: str, var_key: str, query_name: str, value: str, aliases: tuple = ()):
+        raise NotImplementedError
+
+    def remove_user(self, user_id: str):
+        raise NotImplementedError
+
+    def get_bots(self) -> list:
+        raise NotImplementedError
+
+    def save_bot(self, user_id: str, bot_data: dict):
+        raise NotImplementedError
+
+    def remove_bot(self, user_id: str):
+        raise NotImplementedError
@@ -0,0 +1,57 @@
+import os
+from contextlib import contextmanager
+
+from ..journal import JournalStore
+from .base import StorageBackend
+
+
+class JournalBackend(StorageBackend):
+    name = "journal"
+    supports_backup = True
+
+    def __init__(self, cipher, **options):
+        super().__init__(cipher, **options)
+        self.journal_file = f"{self.file_name}.journal"
+        self.journal = JournalStore(
+            self.journal_file,
+            fsync=options.get("journal_fsync", True),
+            compact_ratio=options.get("journal_compact_ratio", 4.0),
+            compact_min_bytes=options.get("journal_compact_min_bytes", 1024 * 1024),
+        )
+
+    def close(self):
+        self.journal.close()
+
+    @contextmanager
+    def backup_files(self):
+        yield {os.path.basename(self.journal_file): self.journal_file} if os.path.exists(self.journal_file) else {}
+
+    def get_user(self, user_id: str, var_key: str = None) -> dict:
+        return self.journal.get_user(user_id)
+
+    def set_var(self, user_id: str, var_key: str, query_name: str, value: str):
+        self.journal.set_var(user_id, var_key, query_name, value)
+
+    def set_vars_many(self, var_key: str, query_name: str, values: dict):
+        self.journal.set_vars_many(var_key, query_name, values)
+
+    def remove_var(self, user_id: str, var_key: str, query_name: str):
+        self.journal.remove_var(user_id, var_key, query_name)
+
+    def add_list_var(self, user_id: str, var_key: str, query_name: str, value: str, aliases: tuple = ()):
+        self.journal.add_list_var(user_id, var_key, query_name, value, aliases)
+
+    def remove_list_var(self, user_id: str, var_key: str, query_name: str, value: str, aliases: tuple = ()):
+        self.journal.remove_list_var(user_id, var_key, query_name, value, aliases)
+
+    def remove_user(self, user_id: str):
+        self.journal.remove_user(user_id)
+
+    def get_bots(self) -> list:
+        return self.journal.get_bots()
+
+    def save_bot(self, user_id: str, bot_data: dict):
+        self.journal.save_bot(user_id, bot_data)
+
+    def remove_bot(self, user_id: str):
+        self.journal.remove_bot(user_id)
@@ -0,0 +1,245 @@
+import atexit
+import copy
+import json
+import os
+import struct
+import tempfile
+import threading
+from contextlib import contextmanager, nullcontext
+
+from .base import StorageBackend
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+
+class LocalBackend(StorageBackend):
+    name = "local"
+    supports_backup = True
+
+    def __init__(self, cipher, **options):
+        super().__init__(cipher, **options)
+        self.data_file = f"{self.file_name}.json"
+        self.lock_file = f"{self.data_file}.lock"
+
+        self.write_back = options.get("write_back", False)
+        self.flush_interval = options.get("flush_interval", 2.0)
+        self.flush_bytes = options.get("flush_bytes", 1024 * 1024)
+        self._data_cache = None
+        self._counter = None
+        self._reloads = 0
+        self._pending = []
+        self._pending_bytes = 0
+        self._flush_timer = None
+
+        self._lock_fd = os.open(self.lock_file, os.O_RDWR | os.O_CREAT, 0o644)
+        with self._lock, self._file_lock(exclusive=True):
+            if not os.path.exists(self.data_file):
+                self._save_data({"vars": {}, "bots": []})
+        if self.write_back:
+            atexit.register(self.flush)
+
+    @contextmanager
+    def _file_lock(self, exclusive=False):
+        if fcntl is None:
+            yield
+            return
+        fcntl.flock(self._lock_fd, fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+        try:
+            yield
+        finally:
+            fcntl.flock(self._lock_fd, fcntl.LOCK_UN)
+
+    def _read_counter(self):
+        os.lseek(self._lock_fd, 0, os.SEEK_SET)
+        raw = os.read(self._lock_fd, 8)
+        return struct.unpack("<Q", raw)[0] if len(raw) == 8 else 0
+
+    def _bump_counter(self):
+        self._counter = self._read_counter() + 1
+        os.lseek(self._lock_fd, 0, os.SEEK_SET)
+        os.write(self._lock_fd, struct.pack("<Q", self._counter))
+
+    def change_counter(self) -> int:
+        with self._lock:
+            if self._lock_fd is not None and self._read_counter() != self._counter:
+                self._load_data()
+            return self._reloads
+
+    def _read_data_file(self):
+        try:
+            with open(self.data_file, "r") as f:
+                return json.load(f)
+        except (json.JSONDecodeError, FileNotFoundError):
+            return {"vars": {}, "bots": []}
+
+    def _load_data(self):
+        with self._lock:
+            counter = self._read_counter()
+            if self._data_cache is None or counter != self._counter:
+                data = self._read_data_file()
+                if self._data_cache is not None:
+                    for record in self._pending:
+                        self._apply(data, record)
+                    self._reloads += 1
+                self._data_cache, self._counter = data, counter
+            return self._data_cache
+
+    def _apply(self, data, record):
+        op = record["op"]
+        users = data.setdefault("vars", {})
+
+        if op == "set":
+            users.setdefault(record["u"], {}).setdefault(record["k"], {})[record["q"]] = record["v"]
+        elif op == "mset":
+            for user_id, value in record["v"].items():
+                users.setdefault(user_id, {}).setdefault(record["k"], {})[record["q"]] = value
+        elif op == "del":
+            return users.get(record["u"], {}).get(record["k"], {}).pop(record["q"], None) is not None
+        elif op == "ladd":
+            group = users.setdefault(record["u"], {}).setdefault(record["k"], {})
+            if not isinstance(group.get(record["q"]), list):
+                group[record["q"]] = []
+            if any(v in group[record["q"]] for v in (record["v"], *record.get("a", ()))):
+                return False
+            group[record["q"]].append(record["v"])
+        elif op == "ldel":
+            values = users.get(record["u"], {}).get(record["k"], {}).get(record["q"])
+            present = [v for v in (record["v"], *record.get("a", ())) if isinstance(values, list) and v in values]
+            for value in present:
+                values.remove(value)
+            return bool(present)
+        elif op == "udel":
+            return users.pop(record["u"], None) is not None
+        elif op == "bot":
+            bots = data.setdefault("bots", [])
+            existing = next((b for b in bots if b.get("user_id") == record["u"]), None)
+            if existing:
+                existing.update(record["d"])
+            else:
+                bots.append({"user_id": record["u"], **record["d"]})
+        elif op == "bdel":
+            bots = data.get("bots", [])
+            data["bots"] = [b for b in bots if b.get("user_id") != record["u"]]
+            return len(data["bots"]) != len(bots)
+        return True
+
+    @contextmanager
+    def _reading(self):
+        with self._lock, nullcontext() if self.write_back else self._file_lock():
+            yield self._load_data()
+
+    def _mutate(self, record):
+        with self._lock, nullcontext() if self.write_back else self._file_lock(exclusive=True):
+            data = self._load_data()
+            try:
+                if self._apply(data, record):
+                    self._commit(data, record)
+            except BaseException:
+                if not self.write_back:
+                    self._data_cache = None
+                raise
+
+    def _save_data(self, data):
+        directory = os.path.dirname(os.path.abspath(self.data_file))
+        fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=f".{os.path.basename(self.data_file)}.", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w") as f:
+                f.write(data if isinstance(data, str) else json.dumps(data, indent=4))
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, self.data_file)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+    def _commit(self, data, record):
+        if not self.write_back:
+            self._save_data(data)
+            self._bump_counter()
+            return
+
+        self._pending.append(record)
+        self._pending_bytes += len(json.dumps(record))
+        if self._pending_bytes >= self.flush_bytes:
+            self.flush()
+        elif self._flush_timer is None:
+            self._flush_timer = threading.Timer(self.flush_interval, self.flush)
+            self._flush_timer.daemon = True
+            self._flush_timer.start()
+
+    def flush(self):
+        if not self.write_back:
+            return
+
+        with self._lock:
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+                self._flush_timer = None
+            if self._lock_fd is None or not self._pending:
+                return
+
+            with self._file_lock(exclusive=True):
+                data = self._load_data()
+                try:
+                    self._save_data(data)
+                    self._bump_counter()
+                except Exception as e:
+                    self.cipher.log.print(f"{self.cipher.log.RED}[DATABASE] Failed to flush write-back data: {e}")
+                    return
+            self._pending.clear()
+            self._pending_bytes = 0
+
+    def close(self):
+        self.flush()
+        if self.write_back:
+            atexit.unregister(self.flush)
+        with self._lock:
+            if self._lock_fd is not None:
+                os.close(self._lock_fd)
+                self._lock_fd = None
+
+    @contextmanager
+    def backup_files(self):
+        self.flush()
+        yield {os.path.basename(self.data_file): self.data_file} if os.path.exists(self.data_file) else {}
+
+    def get_user(self, user_id: str, var_key: str = None) -> dict:
+        with self._reading() as data:
+            return copy.deepcopy(data.get("vars", {}).get(user_id, {}))
+
+    def get_users(self, user_ids: list, var_key: str) -> dict:
+        with self._reading() as data:
+            users = data.get("vars", {})
+            return {user_id: copy.deepcopy(users.get(user_id, {}).get(var_key, {})) for user_id in user_ids}
+
+    def set_var(self, user_id: str, var_key: str, query_name: str, value: str):
+        self._mutate({"op": "set", "u": user_id, "k": var_key, "q": query_name, "v": value})
+
+    def set_vars_many(self, var_key: str, query_name: str, values: dict):
+        self._mutate({"op": "mset", "k": var_key, "q": query_name, "v": dict(values)})
+
+    def remove_var(self, user_id: str, var_key: str, query_name: str):
+        self._mutate({"op": "del", "u": user_id, "k": var_key, "q": query_name})
+
+    def add_list_var(self, user_id: str, var_key: str, query_name: str, value: str, aliases: tuple = ()):
+        self._mutate({"op": "ladd", "u": user_id, "k": var_key, "q": query_name, "v": value, "a": list(aliases)})
+
+    def remove_list_var(self, user_id: str, var_key: str, query_name: str, value: str, aliases: tuple = ()):
+        self._mutate({"op": "ldel", "u": user_id, "k": var_key, "q": query_name, "v": value, "a": list(aliases)})
+
+    def remove_user(self, user_id: str):
+        self._mutate({"op": "udel", "u": user_id})
+
+    def get_bots(self) -> list:
+        with self._reading() as data:
+            return copy.deepcopy(data.get("bots", []))
+
+    def save_bot(self, user_id: str, bot_data: dict):
+        self._mutate({"op": "bot", "u": user_id, "d": dict(bot_data)})
+
+    def remove_bot(self, user_id: str):
+        self._mutate({"op": "bdel", "u": user_id})
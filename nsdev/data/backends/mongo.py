@@ -0,0 +1,71 @@
+from .base import StorageBackend
+
+
+class MongoBackend(StorageBackend):
+    name = "mongo"
+
+    def __init__(self, cipher, **options):
+        super().__init__(cipher, **options)
+        import pymongo
+
+        self.mongo_url = options.get("mongo_url")
+        if not self.mongo_url:
+            raise ValueError("mongo_url is required for MongoDB storage")
+        self.client = pymongo.MongoClient(self.mongo_url)
+        self.data = self.client[self.file_name]
+
+    def close(self):
+        self.client.close()
+
+    def get_user(self, user_id: str, var_key: str = None) -> dict:
+        projection = {var_key: 1} if var_key is not None else None
+        data = self.data.vars.find_one({"_id": user_id}, projection)
+        return data if data else {}
+
+    def get_users(self, user_ids: list, var_key: str) -> dict:
+        raw = {user_id: {} for user_id in user_ids}
+        for doc in self.data.vars.find({"_id": {"$in": user_ids}}, {var_key: 1}):
+            raw[doc["_id"]] = doc.get(var_key, {})
+        return raw
+
+    def set_var(self, user_id: str, var_key: str, query_name: str, value: str):
+        self.data.vars.update_one({"_id": user_id}, {"$set": {f"{var_key}.{query_name}": value}}, upsert=True)
+
+    def set_vars_many(self, var_key: str, query_name: str, values: dict):
+        from pymongo import UpdateOne
+
+        self.data.vars.bulk_write(
+            [
+                UpdateOne({"_id": user_id}, {"$set": {f"{var_key}.{query_name}": value}}, upsert=True)
+                for user_id, value in values.items()
+            ],
+            ordered=False,
+        )
+
+    def remove_var(self, user_id: str, var_key: str, query_name: str):
+        self.data.vars.update_one({"_id": user_id}, {"$unset": {f"{var_key}.{query_name}": ""}})
+
+    def add_list_var(self, user_id: str, var_key: str, query_name: str, value: str, aliases: tuple = ()):
+        from pymongo.errors import DuplicateKeyError
+
+        field = f"{var_key}.{query_name}"
+        query = {"_id": user_id, field: {"$nin": list(aliases)}} if aliases else {"_id": user_id}
+        try:
+            self.data.vars.update_one(query, {"$addToSet": {field: value}}, upsert=True)
+        except DuplicateKeyError:
+            pass
+
+    def remove_list_var(self, user_id: str, var_key: str, query_name: str, value: str, aliases: tuple = ()):
+        self.data.vars.update_one({"_id": user_id}, {"$pull": {f"{var_key}.{query_name}": {"$in": [value, *aliases]}}})
+
+    def remove_user(self, user_id: str):
+        self.data.vars.delete_one({"_id": user_id})
+
+    def get_bots(self) -> list:
+        return list(self.data.bot.find())
+
+    def save_bot(self, user_id: str, bot_data: dict):
+        self.data.bot.update_one({"_id": user_id}, {"$set": bot_data}, upsert=True)
+
+    def remove_bot(self, user_id: str):
+        self.data.bot.delete_one({"_id": user_id})
@@ -0,0 +1,157 @@
+import time
+
+from .base import StorageBackend
+
+_SEP = "\x1f"
+
+
+def _str(value):
+    return value.decode("utf-8") if isinstance(value, bytes) else value
+
+
+class RedisBackend(StorageBackend):
+    name = "redis"
+
+    def __init__(self, cipher, **options):
+        super().__init__(cipher, **options)
+        self.prefix = options.get("redis_prefix", self.file_name)
+        self.client = options.get("redis_client")
+        self._owns_client = self.client is None
+        if self.client is None:
+            import redis
+
+            self.client = redis.Redis.from_url(
+                options.get("redis_url", "redis://localhost:6379/0"), decode_responses=True
+            )
+
+    def close(self):
+        if self._owns_client:
+            self.client.close()
+
+    def _vars_key(self, user_id):
+        return f"{self.prefix}:vars:{user_id}"
+
+    def _lists_key(self, user_id):
+        return f"{self.prefix}:lists:{user_id}"
+
+    def _list_key(self, user_id, field):
+        return f"{self.prefix}:list:{user_id}:{field}"
+
+    def _bot_key(self, user_id):
+        return f"{self.prefix}:bot:{user_id}"
+
+    def _collect(self, user_ids, var_key=None):
+        pipe = self.client.pipeline(transaction=False)
+        for user_id in user_ids:
+            pipe.hgetall(self._vars_key(user_id))
+            pipe.smembers(self._lists_key(user_id))
+        replies = pipe.execute()
+
+        users, pending = {}, []
+        for index, user_id in enumerate(user_ids):
+            user_data = users.setdefault(user_id, {})
+            for field, value in replies[2 * index].items():
+                key, query_name = _str(field).split(_SEP, 1)
+                if var_key is None or key == var_key:
+                    user_data.setdefault(key, {})[query_name] = _str(value)
+            for field in replies[2 * index + 1]:
+                field = _str(field)
+                if var_key is None or field.split(_SEP, 1)[0] == var_key:
+                    pending.append((user_id, field))
+
+        if pending:
+            pipe = self.client.pipeline(transaction=False)
+            for user_id, field in pending:
+                pipe.zrange(self._list_key(user_id, field), 0, -1)
+            for (user_id, field), values in zip(pending, pipe.execute()):
+                key, query_name = field.split(_SEP, 1)
+                users[user_id].setdefault(key, {})[query_name] = [_str(v) for v in values]
+        return users
+
+    def get_user(self, user_id: str, var_key: str = None) -> dict:
+        return self._collect([user_id], var_key)[user_id]
+
+    def get_var(self, user_id: str, var_key: str, query_name: str):
+        return _str(self.client.hget(self._vars_key(user_id), f"{var_key}{_SEP}{query_name}"))
+
+    def get_list(self, user_id: str, var_key: str, query_name: str) -> list:
+        return [_str(v) for v in self.client.zrange(self._list_key(user_id, f"{var_key}{_SEP}{query_name}"), 0, -1)]
+
+    def get_users(self, user_ids: list, var_key: str) -> dict:
+        return {user_id: group.get(var_key, {}) for user_id, group in self._collect(user_ids, var_key).items()}
+
+    def get_vars_many(self, user_ids: list, var_key: str, query_name: str) -> dict:
+        pipe = self.client.pipeline(transaction=False)
+        for user_id in user_ids:
+            pipe.hget(self._vars_key(user_id), f"{var_key}{_SEP}{query_name}")
+        return {user_id: _str(value) for user_id, value in zip(user_ids, pipe.execute())}
+
+    def _queue_set(self, pipe, user_id, field, value):
+        pipe.hset(self._vars_key(user_id), field, value)
+        pipe.delete(self._list_key(user_id, field))
+        pipe.srem(self._lists_key(user_id), field)
+
+    def set_var(self, user_id: str, var_key: str, query_name: str, value: str):
+        pipe = self.client.pipeline()
+        self._queue_set(pipe, user_id, f"{var_key}{_SEP}{query_name}", value)
+        pipe.execute()
+
+    def set_vars_many(self, var_key: str, query_name: str, values: dict):
+        field = f"{var_key}{_SEP}{query_name}"
+        pipe = self.client.pipeline(transaction=False)
+        for user_id, value in values.items():
+            self._queue_set(pipe, user_id, field, value)
+        pipe.execute()
+
+    def remove_var(self, user_id: str, var_key: str, query_name: str):
+        field = f"{var_key}{_SEP}{query_name}"
+        pipe = self.client.pipeline()
+        pipe.hdel(self._vars_key(user_id), field)
+        pipe.delete(self._list_key(user_id, field))
+        pipe.srem(self._lists_key(user_id), field)
+        pipe.execute()
+
+    def add_list_var(self, user_id: str, var_key: str, query_name: str, value: str, aliases: tuple = ()):
+        field = f"{var_key}{_SEP}{query_name}"
+        if aliases and any(
+            score is not None for score in self.client.zmscore(self._list_key(user_id, field), list(aliases))
+        ):
+            return
+        pipe = self.client.pipeline()
+        pipe.hdel(self._vars_key(user_id), field)
+        pipe.sadd(self._lists_key(user_id), field)
+        pipe.zadd(self._list_key(user_id, field), {value: time.time()}, nx=True)
+        pipe.execute()
+
+    def remove_list_var(self, user_id: str, var_key: str, query_name: str, value: str, aliases: tuple = ()):
+        self.client.zrem(self._list_key(user_id, f"{var_key}{_SEP}{query_name}"), value, *aliases)
+
+    def remove_user(self, user_id: str):
+        fields = self.client.smembers(self._lists_key(user_id))
+        pipe = self.client.pipeline()
+        pipe.delete(self._vars_key(user_id), self._lists_key(user_id))
+        for field in fields:
+            pipe.delete(self._list_key(user_id, _str(field)))
+        pipe.execute()
+
+    def get_bots(self) -> list:
+        user_ids = sorted(_str(user_id) for user_id in self.client.smembers(f"{self.prefix}:bots"))
+        pipe = self.client.pipeline(transaction=False)
+        for user_id in user_ids:
+            pipe.hgetall(self._bot_key(user_id))
+        return [
+            {"user_id": user_id, **{_str(k): _str(v) for k, v in data.items()}}
+            for user_id, data in zip(user_ids, pipe.execute())
+        ]
+
+    def save_bot(self, user_id: str, bot_data: dict):
+        pipe = self.client.pipeline()
+        pipe.hset(self._bot_key(user_id), mapping=bot_data)
+        pipe.sadd(f"{self.prefix}:bots", user_id)
+        pipe.execute()
+
+    def remove_bot(self, user_id: str):
+        pipe = self.client.pipeline()
+        pipe.delete(self._bot_key(user_id))
+        pipe.srem(f"{self.prefix}:bots", user_id)
+        pipe.execute()
@@ -0,0 +1,350 @@
+import json
+import os
+import queue
+import sqlite3
+import threading
+from contextlib import contextmanager
+
+from .base import StorageBackend
+
+
+class SQLiteBackend(StorageBackend):
+    name = "sqlite"
+    supports_backup = True
+
+    def __init__(self, cipher, **options):
+        super().__init__(cipher, **options)
+        self.db_file = f"{self.file_name}.db"
+        self.sqlite_wal = options.get("sqlite_wal", True)
+        self.sqlite_synchronous = options.get("sqlite_synchronous", "NORMAL")
+        self.sqlite_pool_size = options.get("sqlite_pool_size", 4)
+        self._readers = queue.LifoQueue()
+        self._reader_count = 0
+        self._tx_depth = 0
+        self._tx_owner = None
+        self.conn = self._connect()
+        self._initialize()
+
+    def _connect(self):
+        conn = sqlite3.connect(self.db_file, check_same_thread=False, cached_statements=256)
+        conn.execute("PRAGMA busy_timeout = 5000")
+        if self.sqlite_wal:
+            conn.execute("PRAGMA journal_mode = WAL")
+        conn.execute(f"PRAGMA synchronous = {self.sqlite_synchronous}")
+        return conn
+
+    @contextmanager
+    def _reader(self):
+        if self._tx_owner == threading.get_ident():
+            yield self.conn
+            return
+
+        try:
+            conn = self._readers.get_nowait()
+        except queue.Empty:
+            with self._lock:
+                can_open = self._reader_count < self.sqlite_pool_size
+                if can_open:
+                    self._reader_count += 1
+            conn = self._connect() if can_open else self._readers.get()
+        try:
+            yield conn
+        finally:
+            self._readers.put(conn)
+
+    def _read(self, query, params=()):
+        with self._reader() as conn:
+            return conn.execute(query, params).fetchall()
+
+    def _write(self, *statements, many=False):
+        with self._lock:
+            try:
+                for query, params in statements:
+                    if many:
+                        self.conn.executemany(query, params)
+                    else:
+                        self.conn.execute(query, params)
+            except BaseException:
+                if self._tx_depth == 0:
+                    self.conn.rollback()
+                raise
+            if self._tx_depth == 0:
+                self.conn.commit()
+
+    def _read_in(self, query, user_ids, params=()):
+        rows = []
+        for i in range(0, len(user_ids), 500):
+            chunk = user_ids[i : i + 500]
+            placeholders = ", ".join("?" * len(chunk))
+            rows.extend(self._read(query.format(placeholders=placeholders), (*params, *chunk)))
+        return rows
+
+    @property
+    def in_transaction(self) -> bool:
+        return self._tx_depth > 0
+
+    @contextmanager
+    def transaction(self):
+        with self._lock:
+            self._tx_depth += 1
+            self._tx_owner = threading.get_ident()
+            try:
+                yield
+            except BaseException:
+                if self._tx_depth == 1:
+                    self.conn.rollback()
+                raise
+            else:
+                if self._tx_depth == 1:
+                    self.conn.commit()
+            finally:
+                self._tx_depth -= 1
+                if self._tx_depth == 0:
+                    self._tx_owner = None
+
+    @contextmanager
+    def backup_files(self):
+        if not os.path.exists(self.db_file):
+            yield {}
+            return
+
+        snapshot_path = f"{self.db_file}.snapshot"
+        target = sqlite3.connect(snapshot_path)
+        try:
+            with self._reader() as conn:
+                conn.backup(target, pages=1024)
+        finally:
+            target.close()
+        try:
+            yield {os.path.basename(self.db_file): snapshot_path}
+        finally:
+            if os.path.exists(snapshot_path):
+                os.remove(snapshot_path)
+
+    def close(self):
+        while not self._readers.empty():
+            self._readers.get_nowait().close()
+        self.conn.close()
+
+    def _initialize(self):
+        cursor = self.conn.cursor()
+        cursor.execute(
+            """
+            CREATE TABLE IF NOT EXISTS user_vars (
+                user_id TEXT NOT NULL, var_key TEXT NOT NULL, query_name TEXT NOT NULL, value TEXT,
+                PRIMARY KEY (user_id, var_key, query_name)
+            ) WITHOUT ROWID
+        """
+        )
+        cursor.execute(
+            """
+            CREATE TABLE IF NOT EXISTS user_list_vars (
+                id INTEGER PRIMARY KEY AUTOINCREMENT, user_id TEXT NOT NULL, var_key TEXT NOT NULL,
+                query_name TEXT NOT NULL, value TEXT NOT NULL
+            )
+        """
+        )
+        cursor.execute(
+            """
+            CREATE UNIQUE INDEX IF NOT EXISTS idx_user_list_vars
+            ON user_list_vars (user_id, var_key, query_name, value)
+        """
+        )
+        cursor.execute(
+            """
+            CREATE TABLE IF NOT EXISTS bots (
+                user_id TEXT PRIMARY KEY, api_id TEXT, api_hash TEXT,
+                bot_token TEXT, session_string TEXT
+            )
+        """
+        )
+        self.conn.commit()
+        self._migrate_vars()
+
+    def _migrate_vars(self):
+        cursor = self.conn.cursor()
+        cursor.execute("SELECT name FROM sqlite_master WHERE type = 'table' AND name = 'vars'")
+        if not cursor.fetchone():
+            return
+
+        cursor.execute("SELECT user_id, data FROM vars")
+        scalar_rows, list_rows = [], []
+        for user_id, data in cursor.fetchall():
+            try:
+                user_data = self.cipher.decrypt(data)
+                if isinstance(user_data, str):
+                    user_data = json.loads(user_data)
+            except Exception as e:
+                self.cipher.log.print(f"{self.cipher.log.YELLOW}[DATABASE] Skipping unreadable vars row {user_id}: {e}")
+                continue
+            if not isinstance(user_data, dict):
+                continue
+            for var_key, entries in user_data.items():
+                for query_name, value in (entries or {}).items():
+                    if isinstance(value, list):
+                        list_rows.extend((user_id, var_key, query_name, v) for v in value)
+                    else:
+                        scalar_rows.append((user_id, var_key, query_name, value))
+
+        with self.conn:
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO user_vars (user_id, var_key, query_name, value) VALUES (?, ?, ?, ?)",
+                scalar_rows,
+            )
+            self.conn.executemany(
+                "INSERT OR IGNORE INTO user_list_vars (user_id, var_key, query_name, value) VALUES (?, ?, ?, ?)",
+                list_rows,
+            )
+            self.conn.execute("ALTER TABLE vars RENAME TO vars_legacy")
+
+        self.cipher.log.print(
+            f"{self.cipher.log.GREEN}[DATABASE] Migrated {len(scalar_rows)} vars and {len(list_rows)} list items "
+            "to the per-key schema."
+        )
+
+    def get_user(self, user_id: str, var_key: str = None) -> dict:
+        where, params = (
+            ("user_id = ?", (user_id,)) if var_key is None else ("user_id = ? AND var_key = ?", (user_id, var_key))
+        )
+        user_data = {}
+        with self._reader() as conn:
+            rows = conn.execute(f"SELECT var_key, query_name, value FROM user_vars WHERE {where}", params)
+            for key, query_name, value in rows.fetchall():
+                user_data.setdefault(key, {})[query_name] = value
+            rows = conn.execute(
+                f"SELECT var_key, query_name, value FROM user_list_vars WHERE {where} ORDER BY id", params
+            )
+            for key, query_name, value in rows.fetchall():
+                user_data.setdefault(key, {}).setdefault(query_name, []).append(value)
+        return user_data
+
+    def get_var(self, user_id: str, var_key: str, query_name: str):
+        rows = self._read(
+            "SELECT value FROM user_vars WHERE user_id = ? AND var_key = ? AND query_name = ?",
+            (user_id, var_key, query_name),
+        )
+        return rows[0][0] if rows else None
+
+    def get_list(self, user_id: str, var_key: str, query_name: str) -> list:
+        rows = self._read(
+            "SELECT value FROM user_list_vars WHERE user_id = ? AND var_key = ? AND query_name = ? ORDER BY id",
+            (user_id, var_key, query_name),
+        )
+        return [row[0] for row in rows]
+
+    def get_users(self, user_ids: list, var_key: str) -> dict:
+        raw = {user_id: {} for user_id in user_ids}
+        rows = self._read_in(
+            "SELECT user_id, query_name, value FROM user_vars WHERE var_key = ? AND user_id IN ({placeholders})",
+            user_ids,
+            (var_key,),
+        )
+        for user_id, query_name, value in rows:
+            raw[user_id][query_name] = value
+        rows = self._read_in(
+            "SELECT user_id, query_name, value FROM user_list_vars "
+            "WHERE var_key = ? AND user_id IN ({placeholders}) ORDER BY id",
+            user_ids,
+            (var_key,),
+        )
+        for user_id, query_name, value in rows:
+            raw[user_id].setdefault(query_name, []).append(value)
+        return raw
+
+    def get_vars_many(self, user_ids: list, var_key: str, query_name: str) -> dict:
+        result = dict.fromkeys(user_ids)
+        rows = self._read_in(
+            "SELECT user_id, value FROM user_vars WHERE var_key = ? AND query_name = ? AND user_id IN ({placeholders})",
+            user_ids,
+            (var_key, query_name),
+        )
+        result.update(rows)
+        return result
+
+    def set_var(self, user_id: str, var_key: str, query_name: str, value: str):
+        key = (user_id, var_key, query_name)
+        self._write(
+            ("DELETE FROM user_list_vars WHERE user_id = ? AND var_key = ? AND query_name = ?", key),
+            (
+                "INSERT OR REPLACE INTO user_vars (user_id, var_key, query_name, value) VALUES (?, ?, ?, ?)",
+                (*key, value),
+            ),
+        )
+
+    def set_vars_many(self, var_key: str, query_name: str, values: dict):
+        self._write(
+            (
+                "DELETE FROM user_list_vars WHERE user_id = ? AND var_key = ? AND query_name = ?",
+                [(user_id, var_key, query_name) for user_id in values],
+            ),
+            (
+                "INSERT OR REPLACE INTO user_vars (user_id, var_key, query_name, value) VALUES (?, ?, ?, ?)",
+                [(user_id, var_key, query_name, value) for user_id, value in values.items()],
+            ),
+            many=True,
+        )
+
+    def remove_var(self, user_id: str, var_key: str, query_name: str):
+        key = (user_id, var_key, query_name)
+        self._write(
+            ("DELETE FROM user_vars WHERE user_id = ? AND var_key = ? AND query_name = ?", key),
+            ("DELETE FROM user_list_vars WHERE user_id = ? AND var_key = ? AND query_name = ?", key),
+        )
+
+    def add_list_var(self, user_id: str, var_key: str, query_name: str, value: str, aliases: tuple = ()):
+        key = (user_id, var_key, query_name)
+        placeholders = ", ".join("?" * len(aliases))
+        insert = (
+            (
+                "INSERT OR IGNORE INTO user_list_vars (user_id, var_key, query_name, value) SELECT ?, ?, ?, ? "
+                "WHERE NOT EXISTS (SELECT 1 FROM user_list_vars "
+                f"WHERE user_id = ? AND var_key = ? AND query_name = ? AND value IN ({placeholders}))",
+                (*key, value, *key, *aliases),
+            )
+            if aliases
+            else (
+                "INSERT OR IGNORE INTO user_list_vars (user_id, var_key, query_name, value) VALUES (?, ?, ?, ?)",
+                (*key, value),
+            )
+        )
+        self._write(("DELETE FROM user_vars WHERE user_id = ? AND var_key = ? AND query_name = ?", key), insert)
+
+    def remove_list_var(self, user_id: str, var_key: str, query_name: str, value: str, aliases: tuple = ()):
+        placeholders = ", ".join("?" * (len(aliases) + 1))
+        self._write(
+            (
+                "DELETE FROM user_list_vars "
+                f"WHERE user_id = ? AND var_key = ? AND query_name = ? AND value IN ({placeholders})",
+                (user_id, var_key, query_name, value, *aliases),
+            )
+        )
+
+    def remove_user(self, user_id: str):
+        self._write(
+            ("DELETE FROM user_vars WHERE user_id = ?", (user_id,)),
+            ("DELETE FROM user_list_vars WHERE user_id = ?", (user_id,)),
+        )
+
+    def get_bots(self) -> list:
+        return [
+            {"user_id": r[0], "api_id": r[1], "api_hash": r[2], "bot_token": r[3], "session_string": r[4]}
+            for r in self._read("SELECT user_id, api_id, api_hash, bot_token, session_string FROM bots")
+        ]
+
+    def save_bot(self, user_id: str, bot_data: dict):
+        self._write(
+            (
+                "INSERT OR REPLACE INTO bots (user_id, api_id, api_hash, bot_token, session_string) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (
+                    user_id,
+                    bot_data["api_id"],
+                    bot_data["api_hash"],
+                    bot_data.get("bot_token"),
+                    bot_data.get("session_string"),
+                ),
+            )
+        )
+
+    def remove_bot(self, user_id: str):
+        self._write(("DELETE FROM bots WHERE user_id = ?", (user_id,)))
@@ -1,14 +1,33 @@
+import asyncio
+import copy
+import functools
 import glob
+import hashlib
 import json
 import os
-import sqlite3
+import threading
 import zipfile
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack, contextmanager
 from datetime import datetime
 from zoneinfo import ZoneInfo
 
 import httpx
 
 from ..code.encrypt import CipherHandler
+from ..utils.cache import LRUCache
+from .backends import BACKENDS, LocalBackend
+
+
+def _invalidates_user(method):
+    @functools.wraps(method)
+    def wrapped(self, user_id, *args, **kwargs):
+        try:
+            return method(self, user_id, *args, **kwargs)
+        finally:
+            self._invalidate_user(user_id)
+
+    return wrapped
 
 
 class DataBase:
@@ -17,36 +36,43 @@ class DataBase:
         self.file_name = options.get("file_name", "database")
         self.keys_encrypt = options.get("keys_encrypt", "default_db_key_12345")
         self.method_encrypt = options.get("method_encrypt", "bytes")
-        self.cipher = CipherHandler(key=self.keys_encrypt, method=self.method_encrypt)
+        self.compact_encrypt = options.get("compact_encrypt", False)
+        self.cipher = CipherHandler(
+            key=self.keys_encrypt,
+            method=self.method_encrypt,
+            compact=self.compact_encrypt,
+            legacy_method=options.get("legacy_method_encrypt", "bytes"),
+        )
+        self.migrate_encrypt = self.method_encrypt == "aesgcm" and options.get("migrate_encrypt", True)
 
         self.auto_backup = options.get("auto_backup", False)
         self.backup_bot_token = options.get("backup_bot_token")
         self.backup_chat_id = options.get("backup_chat_id")
         self.backup_cron_spec = options.get("backup_cron_spec", "0 */3 * * *")
+        self.backup_incremental = options.get("backup_incremental", True)
+        self.backup_chunk_size = options.get("backup_chunk_size", 1024 * 1024)
+        self.backup_manifest_file = f"{self.file_name}.backup_manifest.json"
+        self.backup_encrypt = options.get("backup_encrypt", False)
 
         self.scheduler = options.get("scheduler_instance")
 
-        if self.storage_type == "mongo":
-            import pymongo
-
-            self.mongo_url = options.get("mongo_url")
-            if not self.mongo_url:
-                raise ValueError("mongo_url is required for MongoDB storage")
-            self.client = pymongo.MongoClient(self.mongo_url)
-            self.data = self.client[self.file_name]
-        elif self.storage_type == "sqlite":
-            self.db_file = f"{self.file_name}.db"
-            self.conn = sqlite3.connect(self.db_file, check_same_thread=False)
-            self._initialize_sqlite()
+        self._lock = threading.RLock()
+        cache_size = options.get("cache_size", 0)
+        self._user_cache = LRUCache(cache_size, options.get("cache_ttl")) if cache_size else None
+        self._cache_generation = 0
+        self._backend_changes = None
+        self._tx_users = set()
+
+        self.backend = options.get("backend")
+        if self.backend is None:
+            self.backend = BACKENDS.get(self.storage_type, LocalBackend)(self.cipher, **options)
         else:
-            self.data_file = f"{self.file_name}.json"
-            if not os.path.exists(self.data_file):
-                self._save_data({"vars": {}, "bots": []})
+            self.storage_type = self.backend.name
 
         self._register_backup_task()
 
     def _register_backup_task(self):
-        if self.auto_backup and self.scheduler and self.storage_type in ["local", "sqlite"]:
+        if self.auto_backup and self.scheduler and self.backend.supports_backup:
             if not self.backup_bot_token or not self.backup_chat_id:
                 self.cipher.log.print(
                     f"{self.cipher.log.YELLOW}[BACKUP] Auto backup is disabled because token/chat_id is missing."
@@ -62,50 +88,84 @@ class DataBase:
                 f"{self.cipher.log.GREEN}[BACKUP] Backup task scheduled with spec: '{self.backup_cron_spec}'."
             )
 
-    async def perform_backup(self):
-        source_paths = []
-        db_path = self.data_file if self.storage_type == "local" else self.db_file
+    async def perform_backup(self, full: bool = False):
+        loop = asyncio.get_running_loop()
+        with ExitStack() as stack:
+            source_paths = dict(await loop.run_in_executor(None, stack.enter_context, self.backend.backup_files()))
+            if not source_paths:
+                self.cipher.log.print(
+                    f"{self.cipher.log.YELLOW}[BACKUP] Database file not found. Skipping database backup."
+                )
 
-        if os.path.exists(db_path):
-            source_paths.append(db_path)
-        else:
-            self.cipher.log.print(
-                f"{self.cipher.log.YELLOW}[BACKUP] Database file not found. Skipping database backup."
-            )
+            for env_file in glob.glob("*.env"):
+                source_paths[os.path.basename(env_file)] = env_file
 
-        env_files = glob.glob("*.env")
-        if env_files:
-            source_paths.extend(env_files)
+            if not source_paths:
+                self.cipher.log.print(f"{self.cipher.log.RED}[BACKUP] No files to back up. Aborting.")
+                return
 
-        if not source_paths:
-            self.cipher.log.print(f"{self.cipher.log.RED}[BACKUP] No files to back up. Aborting.")
-            return
+            digests = await loop.run_in_executor(None, self._hash_files, source_paths)
+            manifest = {} if full or not self.backup_incremental else self._load_backup_manifest()
+            changed = {name: path for name, path in source_paths.items() if manifest.get(name) != digests[name]}
+            if not changed:
+                self.cipher.log.print(f"{self.cipher.log.CYAN}[BACKUP] No changes since the last backup. Skipping.")
+                return
 
-        zip_path = None
+            zip_path = await loop.run_in_executor(None, self._create_zip_archive, changed)
+            if not zip_path:
+                return
+            stack.callback(os.remove, zip_path)
+
+            timestamp = datetime.now(ZoneInfo("Asia/Jakarta")).strftime("%Y-%m-%d %H:%M:%S %Z")
+            caption = (
+                f"Backup otomatis untuk `{os.path.basename(zip_path)}`\n"
+                f"Tipe DB: `{self.storage_type}`\n"
+                f"File: `{len(changed)}/{len(source_paths)}` berubah\n"
+                f"Terenkripsi: `{'ya' if self.backup_encrypt else 'tidak'}`\n"
+                f"Waktu: `{timestamp}`"
+            )
+            if await self._send_zip_to_telegram(zip_path, caption):
+                self._save_backup_manifest({**manifest, **{name: digests[name] for name in changed}})
+
+    def _hash_files(self, source_paths: dict):
+        digests = {}
+        for name, path in source_paths.items():
+            digest = hashlib.sha256()
+            with open(path, "rb") as f:
+                for chunk in iter(lambda: f.read(self.backup_chunk_size), b""):
+                    digest.update(chunk)
+            digests[name] = digest.hexdigest()
+        return digests
+
+    def _load_backup_manifest(self):
         try:
-            zip_path = self._create_zip_archive(source_paths)
-            if zip_path:
-                timestamp = datetime.now(ZoneInfo("Asia/Jakarta")).strftime("%Y-%m-%d %H:%M:%S %Z")
-                caption = (
-                    f"Backup otomatis untuk `{os.path.basename(zip_path)}`\n"
-                    f"Tipe DB: `{self.storage_type}`\n"
-                    f"Waktu: `{timestamp}`"
-                )
-                await self._send_zip_to_telegram(zip_path, caption)
-        finally:
-            if zip_path and os.path.exists(zip_path):
-                os.remove(zip_path)
+            with open(self.backup_manifest_file, "r") as f:
+                return json.load(f)
+        except (json.JSONDecodeError, FileNotFoundError):
+            return {}
 
-    def _create_zip_archive(self, source_paths: list):
+    def _save_backup_manifest(self, manifest: dict):
+        with open(self.backup_manifest_file, "w") as f:
+            json.dump(manifest, f, indent=4)
+
+    def _create_zip_archive(self, source_paths: dict):
         timestamp = datetime.now(ZoneInfo("Asia/Jakarta")).strftime("%Y%m%d_%H%M%S")
-        zip_filename = f"backup_{self.file_name}_{timestamp}.zip"
+        zip_filename = f"backup_{self.file_name}_{timestamp}.zip{'.enc' if self.backup_encrypt else ''}"
         try:
-            with zipfile.ZipFile(zip_filename, "w", zipfile.ZIP_DEFLATED) as zf:
-                for path in source_paths:
-                    zf.write(path, os.path.basename(path))
+            with open(zip_filename, "wb") as raw:
+                archive = self.cipher.encryptor(raw) if self.backup_encrypt else raw
+                with zipfile.ZipFile(archive, "w", zipfile.ZIP_DEFLATED) as zf:
+                    for name, path in source_paths.items():
+                        with open(path, "rb") as source, zf.open(name, "w", force_zip64=True) as target:
+                            for chunk in iter(lambda: source.read(self.backup_chunk_size), b""):
+                                target.write(chunk)
+                if self.backup_encrypt:
+                    archive.close()
             return zip_filename
         except Exception as e:
             self.cipher.log.print(f"{self.cipher.log.RED}[BACKUP] Failed to create ZIP archive: {e}")
+            if os.path.exists(zip_filename):
+                os.remove(zip_filename)
             return None
 
     async def _send_zip_to_telegram(self, file_path, caption):
@@ -114,30 +174,21 @@ class DataBase:
             with open(file_path, "rb") as doc:
                 files = {"document": doc}
                 params = {"chat_id": self.backup_chat_id, "caption": caption, "parse_mode": "Markdown"}
-                async with httpx.AsyncClient(timeout=60) as client:
+                async with httpx.AsyncClient(timeout=httpx.Timeout(60, write=None)) as client:
                     response = await client.post(url, params=params, files=files)
 
             response.raise_for_status()
             response_data = response.json()
             if response_data.get("ok"):
                 self.cipher.log.print(f"{self.cipher.log.GREEN}[BACKUP] Successfully sent to Telegram.")
-            else:
-                self.cipher.log.print(
-                    f"{self.cipher.log.RED}[BACKUP] Failed to send: {response_data.get('description')}"
-                )
+                return True
+            self.cipher.log.print(f"{self.cipher.log.RED}[BACKUP] Failed to send: {response_data.get('description')}")
         except Exception as e:
             self.cipher.log.print(f"{self.cipher.log.RED}[BACKUP] Failed to send file to Telegram: {e}")
+        return False
 
-    def _load_data(self):
-        try:
-            with open(self.data_file, "r") as f:
-                return json.load(f)
-        except (json.JSONDecodeError, FileNotFoundError):
-            return {"vars": {}, "bots": []}
-
-    def _save_data(self, data):
-        with open(self.data_file, "w") as f:
-            json.dump(data, f, indent=4)
+    def flush(self):
+        self.backend.flush()
 
     def __del__(self):
         self.close()
@@ -146,139 +197,219 @@ class DataBase:
         self.close()
 
     def close(self):
-        if self.storage_type == "sqlite" and hasattr(self, "conn") and self.conn:
-            self.conn.close()
-
-    def _initialize_sqlite(self):
-        cursor = self.conn.cursor()
-        cursor.execute("CREATE TABLE IF NOT EXISTS vars (user_id TEXT PRIMARY KEY, data TEXT)")
-        cursor.execute(
-            """
-            CREATE TABLE IF NOT EXISTS bots (
-                user_id TEXT PRIMARY KEY, api_id TEXT, api_hash TEXT,
-                bot_token TEXT, session_string TEXT
-            )
-        """
-        )
-        self.conn.commit()
+        if hasattr(self, "backend"):
+            self.backend.close()
 
-    def _get_user_vars(self, user_id):
+    @contextmanager
+    def transaction(self):
+        try:
+            with self.backend.transaction():
+                yield self
+        finally:
+            if not self.backend.in_transaction:
+                with self._lock:
+                    for user_id in self._tx_users:
+                        self._invalidate_user(user_id)
+                    self._tx_users.clear()
+
+    def _invalidate_user(self, user_id):
+        if self._user_cache is None:
+            return
         user_id_str = str(user_id)
-        if self.storage_type == "sqlite":
-            cursor = self.conn.cursor()
-            cursor.execute("SELECT data FROM vars WHERE user_id = ?", (user_id_str,))
-            row = cursor.fetchone()
-            return json.loads(self.cipher.decrypt(row[0])) if row else {}
-        elif self.storage_type == "mongo":
-            data = self.data.vars.find_one({"_id": user_id_str})
-            return data if data else {}
-        else:
-            return self._load_data().get("vars", {}).get(user_id_str, {})
+        with self._lock:
+            self._cache_generation += 1
+            self._user_cache.pop(user_id_str)
+            if self.backend.in_transaction:
+                self._tx_users.add(user_id_str)
+
+    def _cached_group(self, user_id, var_key):
+        changes = self.backend.change_counter()
+        if changes != self._backend_changes:
+            with self._lock:
+                self._cache_generation += 1
+                self._user_cache.clear()
+                self._backend_changes = changes
 
-    def _set_user_vars(self, user_id, user_data):
         user_id_str = str(user_id)
-        if self.storage_type == "sqlite":
-            encrypted_data = self.cipher.encrypt(json.dumps(user_data))
-            self.conn.execute(
-                "INSERT OR REPLACE INTO vars (user_id, data) VALUES (?, ?)", (user_id_str, encrypted_data)
-            )
-            self.conn.commit()
-        elif self.storage_type == "mongo":
-            self.data.vars.update_one({"_id": user_id_str}, {"$set": user_data}, upsert=True)
-        else:
-            full_data = self._load_data()
-            full_data["vars"][user_id_str] = user_data
-            self._save_data(full_data)
+        entry = self._user_cache.get(user_id_str)
+        if entry is None:
+            generation = self._cache_generation
+            entry = {"raw": self.backend.get_user(user_id_str), "groups": {}}
+            self._migrate_user(user_id_str, entry["raw"])
+            with self._lock:
+                if generation == self._cache_generation:
+                    self._user_cache.set(user_id_str, entry)
+
+        group = entry["groups"].get(var_key)
+        if group is None:
+            group = self._decrypt_group(entry["raw"].get(var_key, {}))
+            entry["groups"][var_key] = group
+        return group
+
+    def cache_info(self):
+        return self._user_cache.info() if self._user_cache is not None else None
+
+    def cache_clear(self):
+        if self._user_cache is not None:
+            with self._lock:
+                self._cache_generation += 1
+                self._user_cache.clear()
+
+    def _encrypt_value(self, value, compact=None):
+        return self.cipher.encrypt(
+            json.dumps(value) if isinstance(value, (dict, list)) else str(value), compact=compact
+        )
 
-    def setVars(self, user_id, query_name, value, var_key="variabel"):
-        encrypted_value = self.cipher.encrypt(json.dumps(value) if isinstance(value, (dict, list)) else str(value))
-        user_data = self._get_user_vars(user_id)
-        if var_key not in user_data:
-            user_data[var_key] = {}
-        user_data[var_key][query_name] = encrypted_value
-        self._set_user_vars(user_id, user_data)
+    def _encrypt_candidates(self, value):
+        plaintext = json.dumps(value) if isinstance(value, (dict, list)) else str(value)
+        return self.cipher.encrypt(plaintext), self.cipher.encrypt_aliases(plaintext)
 
-    def getVars(self, user_id, query_name, var_key="variabel"):
-        user_data = self._get_user_vars(user_id)
-        encrypted_value = user_data.get(var_key, {}).get(query_name)
-        if not encrypted_value:
-            return None
+    def _migrate_var(self, user_id_str, var_key, query_name, stored):
+        values = stored if isinstance(stored, list) else [stored]
+        if not self.migrate_encrypt or not any(map(self.cipher.needs_migration, values)):
+            return
+        try:
+            with self.backend.transaction():
+                if isinstance(stored, list):
+                    if self.backend.get_list(user_id_str, var_key, query_name) != stored:
+                        return
+                    self.backend.remove_var(user_id_str, var_key, query_name)
+                    for value in stored:
+                        self.backend.add_list_var(user_id_str, var_key, query_name, self.cipher.reencrypt(value))
+                elif self.backend.get_var(user_id_str, var_key, query_name) == stored:
+                    self.backend.set_var(user_id_str, var_key, query_name, self.cipher.reencrypt(stored))
+        except Exception as e:
+            self.cipher.log.print(f"{self.cipher.log.YELLOW}[DATABASE] Failed to migrate {user_id_str}/{var_key}: {e}")
+
+    def _migrate_user(self, user_id_str, raw):
+        if not self.migrate_encrypt:
+            return
+        for var_key, group in raw.items():
+            if isinstance(group, dict):
+                for query_name, stored in group.items():
+                    self._migrate_var(user_id_str, var_key, query_name, stored)
+
+    def _decrypt_value(self, encrypted_value):
         decrypted_str = self.cipher.decrypt(encrypted_value)
         try:
             return json.loads(decrypted_str)
         except (json.JSONDecodeError, TypeError):
             return decrypted_str
 
+    def _decrypt_values(self, encrypted_values):
+        decrypted = self.cipher.decrypt_many(encrypted_values)
+        for index, value in enumerate(decrypted):
+            if isinstance(value, str):
+                try:
+                    decrypted[index] = json.loads(value)
+                except json.JSONDecodeError:
+                    pass
+        return decrypted
+
+    def _decrypt_group(self, encrypted_data):
+        flat = []
+        for value in encrypted_data.values():
+            flat.extend(value if isinstance(value, list) else (value,))
+        decrypted = iter(self._decrypt_values(flat))
+        return {
+            key: [next(decrypted) for _ in value] if isinstance(value, list) else next(decrypted)
+            for key, value in encrypted_data.items()
+        }
+
+    @_invalidates_user
+    def setVars(self, user_id, query_name, value, var_key="variabel"):
+        self.backend.set_var(str(user_id), var_key, query_name, self._encrypt_value(value))
+
+    def getVars(self, user_id, query_name, var_key="variabel"):
+        if self._user_cache is not None:
+            value = self._cached_group(user_id, var_key).get(query_name)
+            return None if isinstance(value, list) else copy.deepcopy(value)
+        encrypted_value = self.backend.get_var(str(user_id), var_key, query_name)
+        if not encrypted_value or isinstance(encrypted_value, list):
+            return None
+        self._migrate_var(str(user_id), var_key, query_name, encrypted_value)
+        return self._decrypt_value(encrypted_value)
+
+    @_invalidates_user
     def removeVars(self, user_id, query_name, var_key="variabel"):
-        user_data = self._get_user_vars(user_id)
-        if user_data.get(var_key, {}).pop(query_name, None):
-            self._set_user_vars(user_id, user_data)
+        self.backend.remove_var(str(user_id), var_key, query_name)
 
+    @_invalidates_user
     def setListVars(self, user_id, query_name, value, var_key="variabel"):
-        encrypted_value = self.cipher.encrypt(json.dumps(value) if isinstance(value, (dict, list)) else str(value))
-        user_data = self._get_user_vars(user_id)
-        if var_key not in user_data:
-            user_data[var_key] = {}
-        if query_name not in user_data[var_key]:
-            user_data[var_key][query_name] = []
-        if encrypted_value not in user_data[var_key][query_name]:
-            user_data[var_key][query_name].append(encrypted_value)
-            self._set_user_vars(user_id, user_data)
+        self.backend.add_list_var(str(user_id), var_key, query_name, *self._encrypt_candidates(value))
 
     def getListVars(self, user_id, query_name, var_key="variabel"):
-        user_data = self._get_user_vars(user_id)
-        encrypted_list = user_data.get(var_key, {}).get(query_name, [])
-        return [
-            json.loads(self.cipher.decrypt(v)) if v.startswith(("[", "{")) else self.cipher.decrypt(v)
-            for v in encrypted_list
-        ]
-
+        if self._user_cache is not None:
+            values = self._cached_group(user_id, var_key).get(query_name)
+            return copy.deepcopy(values) if isinstance(values, list) else []
+        encrypted_values = self.backend.get_list(str(user_id), var_key, query_name)
+        self._migrate_var(str(user_id), var_key, query_name, encrypted_values)
+        return self.cipher.decrypt_many(encrypted_values)
+
+    @_invalidates_user
     def removeListVars(self, user_id, query_name, value, var_key="variabel"):
-        encrypted_value = self.cipher.encrypt(json.dumps(value) if isinstance(value, (dict, list)) else str(value))
-        user_data = self._get_user_vars(user_id)
-        try:
-            user_data.get(var_key, {}).get(query_name, []).remove(encrypted_value)
-            self._set_user_vars(user_id, user_data)
-        except (ValueError, KeyError):
-            pass
+        self.backend.remove_list_var(str(user_id), var_key, query_name, *self._encrypt_candidates(value))
 
+    @_invalidates_user
     def removeAllVars(self, user_id):
-        user_id_str = str(user_id)
-        if self.storage_type == "sqlite":
-            self.conn.execute("DELETE FROM vars WHERE user_id = ?", (user_id_str,))
-            self.conn.commit()
-        elif self.storage_type == "mongo":
-            self.data.vars.delete_one({"_id": user_id_str})
-        else:
-            full_data = self._load_data()
-            full_data.get("vars", {}).pop(user_id_str, None)
-            self._save_data(full_data)
+        self.backend.remove_user(str(user_id))
 
     def allVars(self, user_id, var_key="variabel"):
-        user_data = self._get_user_vars(user_id)
-        encrypted_data = user_data.get(var_key, {})
-
-        decrypted = {}
-        for key, value in encrypted_data.items():
-            if isinstance(value, list):
-                temp_list = []
-                for v in value:
-                    decrypted_v_str = self.cipher.decrypt(v)
-                    try:
-                        temp_list.append(json.loads(decrypted_v_str))
-                    except (json.JSONDecodeError, TypeError):
-                        temp_list.append(decrypted_v_str)
-                decrypted[key] = temp_list
-            else:
-                decrypted_v_str = self.cipher.decrypt(value)
-                try:
-                    decrypted[key] = json.loads(decrypted_v_str)
-                except (json.JSONDecodeError, TypeError):
-                    decrypted[key] = decrypted_v_str
-        return decrypted
+        if self._user_cache is not None:
+            return copy.deepcopy(self._cached_group(user_id, var_key))
+        raw = self.backend.get_user(str(user_id), var_key)
+        self._migrate_user(str(user_id), raw)
+        return self._decrypt_group(raw.get(var_key, {}))
+
+    def _get_groups_many(self, user_ids, var_key):
+        id_map = {str(user_id): user_id for user_id in user_ids}
+        groups = {}
+        if self._user_cache is not None:
+            for user_id_str in list(id_map):
+                if user_id_str in self._user_cache:
+                    groups[id_map.pop(user_id_str)] = copy.deepcopy(self._cached_group(user_id_str, var_key))
+
+        if id_map:
+            raw = self.backend.get_users(list(id_map), var_key)
+            for user_id_str, user_id in id_map.items():
+                self._migrate_user(user_id_str, {var_key: raw.get(user_id_str, {})})
+                groups[user_id] = self._decrypt_group(raw.get(user_id_str, {}))
+        return {user_id: groups[user_id] for user_id in user_ids}
+
+    def getVarsMany(self, user_ids, query_name, var_key="variabel"):
+        user_ids = list(user_ids)
+        if self._user_cache is None:
+            id_map = {str(user_id): user_id for user_id in user_ids}
+            raw = self.backend.get_vars_many(list(id_map), var_key, query_name)
+            for user_id_str, value in raw.items():
+                if value and not isinstance(value, list):
+                    self._migrate_var(user_id_str, var_key, query_name, value)
+            return {
+                id_map[user_id_str]: (self._decrypt_value(value) if value and not isinstance(value, list) else None)
+                for user_id_str, value in raw.items()
+            }
+
+        result = {}
+        for user_id, group in self._get_groups_many(user_ids, var_key).items():
+            value = group.get(query_name)
+            result[user_id] = None if value is None or isinstance(value, list) else copy.deepcopy(value)
+        return result
+
+    def allVarsMany(self, user_ids, var_key="variabel"):
+        return self._get_groups_many(list(user_ids), var_key)
+
+    def setVarsMany(self, values: dict, query_name, var_key="variabel"):
+        if not values:
+            return
+
+        encrypted = {str(user_id): self._encrypt_value(value) for user_id, value in values.items()}
+        try:
+            self.backend.set_vars_many(var_key, query_name, encrypted)
+        finally:
+            for user_id in encrypted:
+                self._invalidate_user(user_id)
 
     def saveBot(self, user_id, api_id, api_hash, value, is_token=False):
-        user_id_str = str(user_id)
         field = "bot_token" if is_token else "session_string"
         bot_data = {
             "api_id": self.cipher.encrypt(str(api_id)),
@@ -286,70 +417,142 @@ class DataBase:
         }
         if value:
             bot_data[field] = self.cipher.encrypt(value)
-
-        if self.storage_type == "mongo":
-            self.data.bot.update_one({"_id": user_id_str}, {"$set": bot_data}, upsert=True)
-        elif self.storage_type == "sqlite":
-            self.conn.execute(
-                """
-                INSERT OR REPLACE INTO bots (user_id, api_id, api_hash, bot_token, session_string) 
-                VALUES (?, ?, ?, ?, ?)
-            """,
-                (
-                    user_id_str,
-                    bot_data["api_id"],
-                    bot_data["api_hash"],
-                    bot_data.get("bot_token"),
-                    bot_data.get("session_string"),
-                ),
-            )
-            self.conn.commit()
-        else:
-            data = self._load_data()
-            existing = next((b for b in data["bots"] if b.get("user_id") == user_id_str), None)
-            if existing:
-                existing.update(bot_data)
-            else:
-                data["bots"].append({"user_id": user_id_str, **bot_data})
-            self._save_data(data)
+        self.backend.save_bot(str(user_id), bot_data)
 
     def getBots(self, is_token=False):
-        raw_bots = []
-        if self.storage_type == "mongo":
-            raw_bots = self.data.bot.find()
-        elif self.storage_type == "sqlite":
-            cursor = self.conn.cursor()
-            cursor.execute("SELECT user_id, api_id, api_hash, bot_token, session_string FROM bots")
-            raw_bots = [
-                {"user_id": r[0], "api_id": r[1], "api_hash": r[2], "bot_token": r[3], "session_string": r[4]}
-                for r in cursor.fetchall()
-            ]
-        else:
-            raw_bots = self._load_data().get("bots", [])
+        fields = ("api_id", "api_hash", "bot_token", "session_string")
+        bots = self.backend.get_bots()
+        try:
+            plain = iter(
+                self.cipher.decrypt_many(
+                    [bot_data[key] for bot_data in bots for key in fields if bot_data.get(key)], parse_json=False
+                )
+            )
+        except (ValueError, TypeError):
+            plain = None
 
         decrypted_bots = []
-        for bot_data in raw_bots:
+        for bot_data in bots:
+            present = [key for key in fields if bot_data.get(key)]
+            values = [next(plain) for _ in present] if plain is not None else None
             try:
                 decrypted = {"name": bot_data.get("user_id") or bot_data.get("_id")}
-                for key in ["api_id", "api_hash", "bot_token", "session_string"]:
-                    if bot_data.get(key):
-                        value = self.cipher.decrypt(bot_data[key])
-                        decrypted[key] = int(value) if key == "api_id" else value
+                for index, key in enumerate(present):
+                    value = values[index] if values is not None else self.cipher.decrypt_text(bot_data[key])
+                    decrypted[key] = int(value) if key == "api_id" else value
 
                 if (is_token and "bot_token" in decrypted) or (not is_token and "session_string" in decrypted):
                     decrypted_bots.append(decrypted)
+                self._migrate_bot(decrypted["name"], bot_data)
             except (ValueError, TypeError):
                 continue
         return decrypted_bots
 
+    def _migrate_bot(self, user_id_str, bot_data):
+        fields = ("api_id", "api_hash", "bot_token", "session_string")
+        if not self.migrate_encrypt or not any(self.cipher.needs_migration(bot_data.get(key)) for key in fields):
+            return
+        try:
+            self.backend.save_bot(
+                str(user_id_str), {key: self.cipher.reencrypt(bot_data[key]) for key in fields if bot_data.get(key)}
+            )
+        except Exception as e:
+            self.cipher.log.print(f"{self.cipher.log.YELLOW}[DATABASE] Failed to migrate bot {user_id_str}: {e}")
+
     def removeBot(self, user_id):
-        user_id_str = str(user_id)
-        if self.storage_type == "mongo":
-            self.data.bot.delete_one({"_id": user_id_str})
-        elif self.storage_type == "sqlite":
-            self.conn.execute("DELETE FROM bots WHERE user_id = ?", (user_id_str,))
-            self.conn.commit()
-        else:
-            data = self._load_data()
-            data["bots"] = [b for b in data["bots"] if b.get("user_id") != user_id_str]
-            self._save_data(data)
+        self.backend.remove_bot(str(user_id))
+
+
+async def call_database(database, method: str, *args, **kwargs):
+    if isinstance(database, AsyncDataBase):
+        return await getattr(database, method)(*args, **kwargs)
+    return await asyncio.to_thread(getattr(database, method), *args, **kwargs)
+
+
+class AsyncDataBase:
+    def __init__(self, database: DataBase = None, **options):
+        self.db = database if database is not None else DataBase(**options)
+        default_workers = 1 if self.db.storage_type in ("local", "journal") else 4
+        self._executor = ThreadPoolExecutor(
+            max_workers=options.get("max_workers", default_workers), thread_name_prefix="nsdev-db"
+        )
+        self._inflight = {}
+        self._writes = 0
+
+    async def _run(self, method, *args, **kwargs):
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, functools.partial(getattr(self.db, method), *args, **kwargs))
+
+    async def _write(self, method, *args, **kwargs):
+        self._writes += 1
+        try:
+            return await self._run(method, *args, **kwargs)
+        finally:
+            self._writes += 1
+
+    async def _read(self, method, *args, **kwargs):
+        key = (self._writes, method, args, tuple(sorted(kwargs.items())))
+        try:
+            future = self._inflight.get(key)
+        except TypeError:
+            return await self._run(method, *args, **kwargs)
+
+        if future is not None:
+            return copy.deepcopy(await asyncio.shield(future))
+
+        future = asyncio.ensure_future(self._run(method, *args, **kwargs))
+        self._inflight[key] = future
+        future.add_done_callback(lambda _: self._inflight.pop(key, None))
+        return await asyncio.shield(future)
+
+    async def setVars(self, user_id, query_name, value, var_key="variabel"):
+        await self._write("setVars", user_id, query_name, value, var_key=var_key)
+
+    async def getVars(self, user_id, query_name, var_key="variabel"):
+        return await self._read("getVars", user_id, query_name, var_key=var_key)
+
+    async def removeVars(self, user_id, query_name, var_key="variabel"):
+        await self._write("removeVars", user_id, query_name, var_key=var_key)
+
+    async def setListVars(self, user_id, query_name, value, var_key="variabel"):
+        await self._write("setListVars", user_id, query_name, value, var_key=var_key)
+
+    async def getListVars(self, user_id, query_name, var_key="variabel"):
+        return await self._read("getListVars", user_id, query_name, var_key=var_key)
+
+    async def removeListVars(self, user_id, query_name, value, var_key="variabel"):
+        await self._write("removeListVars", user_id, query_name, value, var_key=var_key)
+
+    async def removeAllVars(self, user_id):
+        await self._write("removeAllVars", user_id)
+
+    async def allVars(self, user_id, var_key="variabel"):
+        return await self._read("allVars", user_id, var_key=var_key)
+
+    async def getVarsMany(self, user_ids, query_name, var_key="variabel"):
+        return await self._run("getVarsMany", list(user_ids), query_name, var_key=var_key)
+
+    async def setVarsMany(self, values: dict, query_name, var_key="variabel"):
+        await self._write("setVarsMany", values, query_name, var_key=var_key)
+
+    async def allVarsMany(self, user_ids, var_key="variabel"):
+        return await self._run("allVarsMany", list(user_ids), var_key=var_key)
+
+    async def saveBot(self, user_id, api_id, api_hash, value, is_token=False):
+        await self._write("saveBot", user_id, api_id, api_hash, value, is_token=is_token)
+
+    async def getBots(self, is_token=False):
+        return await self._read("getBots", is_token=is_token)
+
+    async def removeBot(self, user_id):
+        await self._write("removeBot", user_id)
+
+    async def flush(self):
+        await self._run("flush")
+
+    async def perform_backup(self, full: bool = False):
+        await self.db.perform_backup(full=full)
+
+    async def close(self):
+        await self._run("close")
+        self._executor.shutdown(wait=False)
@@ -0,0 +1,189 @@
+import copy
+import json
+import os
+import tempfile
+import threading
+
+
+class JournalStore:
+    def __init__(self, path: str, **options):
+        self.path = path
+        self.fsync = options.get("fsync", True)
+        self.compact_ratio = options.get("compact_ratio", 4.0)
+        self.compact_min_bytes = options.get("compact_min_bytes", 1024 * 1024)
+
+        self._lock = threading.RLock()
+        self._compacting = False
+        self._compact_thread = None
+        self._state = {"vars": {}, "bots": {}}
+        self._snapshot_size = 0
+        self._size = 0
+
+        self._replay()
+        self._file = open(self.path, "ab")
+
+    def _replay(self):
+        if not os.path.exists(self.path):
+            return
+
+        valid_offset = 0
+        with open(self.path, "rb") as f:
+            for line in f:
+                if not line.endswith(b"\n"):
+                    break
+                try:
+                    record = json.loads(line)
+                except (json.JSONDecodeError, UnicodeDecodeError):
+                    break
+                self._apply(record)
+                if record.get("op") == "snapshot":
+                    self._snapshot_size = len(line)
+                valid_offset += len(line)
+
+        if valid_offset != os.path.getsize(self.path):
+            with open(self.path, "r+b") as f:
+                f.truncate(valid_offset)
+        self._size = valid_offset
+
+    def _apply(self, record):
+        op = record.get("op")
+        users = self._state["vars"]
+
+        if op == "snapshot":
+            self._state = {"vars": record["data"].get("vars", {}), "bots": record["data"].get("bots", {})}
+        elif op == "set":
+            users.setdefault(record["u"], {}).setdefault(record["k"], {})[record["q"]] = record["v"]
+        elif op == "del":
+            users.get(record["u"], {}).get(record["k"], {}).pop(record["q"], None)
+        elif op == "ladd":
+            group = users.setdefault(record["u"], {}).setdefault(record["k"], {})
+            if not isinstance(group.get(record["q"]), list):
+                group[record["q"]] = []
+            group[record["q"]].append(record["v"])
+        elif op == "ldel":
+            values = users.get(record["u"], {}).get(record["k"], {}).get(record["q"])
+            if isinstance(values, list) and record["v"] in values:
+                values.remove(record["v"])
+        elif op == "udel":
+            users.pop(record["u"], None)
+        elif op == "bot":
+            self._state["bots"].setdefault(record["u"], {}).update(record["d"])
+        elif op == "bdel":
+            self._state["bots"].pop(record["u"], None)
+
+    def _append(self, *records):
+        data = b"".join((json.dumps(record, separators=(",", ":")) + "\n").encode("utf-8") for record in records)
+        with self._lock:
+            self._file.write(data)
+            self._file.flush()
+            if self.fsync:
+                os.fsync(self._file.fileno())
+            self._size += len(data)
+            for record in records:
+                self._apply(record)
+            self._maybe_compact()
+
+    def _maybe_compact(self):
+        if self._compacting or self._size < self.compact_min_bytes:
+            return
+        if self._size < self._snapshot_size * self.compact_ratio:
+            return
+        self._compacting = True
+        self._compact_thread = threading.Thread(target=self.compact, daemon=True)
+        self._compact_thread.start()
+
+    def compact(self):
+        with self._lock:
+            self._compacting = True
+            snapshot = (json.dumps({"op": "snapshot", "data": self._state}, separators=(",", ":")) + "\n").encode(
+                "utf-8"
+            )
+            offset = self._size
+
+        directory = os.path.dirname(os.path.abspath(self.path))
+        fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=f".{os.path.basename(self.path)}.", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as tmp:
+                tmp.write(snapshot)
+                with self._lock:
+                    with open(self.path, "rb") as source:
+                        source.seek(offset)
+                        tail = source.read()
+                    tmp.write(tail)
+                    tmp.flush()
+                    os.fsync(tmp.fileno())
+                    self._file.close()
+                    os.replace(tmp_path, self.path)
+                    self._file = open(self.path, "ab")
+                    self._snapshot_size = len(snapshot)
+                    self._size = len(snapshot) + len(tail)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+        finally:
+            self._compacting = False
+
+    def close(self):
+        thread = self._compact_thread
+        if thread and thread.is_alive() and thread is not threading.current_thread():
+            thread.join()
+        with self._lock:
+            if not self._file.closed:
+                self._file.close()
+
+    def get_user(self, user_id: str) -> dict:
+        with self._lock:
+            return copy.deepcopy(self._state["vars"].get(user_id, {}))
+
+    def set_var(self, user_id: str, var_key: str, query_name: str, value: str):
+        self._append({"op": "set", "u": user_id, "k": var_key, "q": query_name, "v": value})
+
+    def set_vars_many(self, var_key: str, query_name: str, values: dict):
+        self._append(
+            *(
+                {"op": "set", "u": user_id, "k": var_key, "q": query_name, "v": value}
+                for user_id, value in values.items()
+            )
+        )
+
+    def remove_var(self, user_id: str, var_key: str, query_name: str) -> bool:
+        with self._lock:
+            if not self._state["vars"].get(user_id, {}).get(var_key, {}).get(query_name):
+                return False
+            self._append({"op": "del", "u": user_id, "k": var_key, "q": query_name})
+            return True
+
+    def add_list_var(self, user_id: str, var_key: str, query_name: str, value: str, aliases: tuple = ()) -> bool:
+        with self._lock:
+            values = self._state["vars"].get(user_id, {}).get(var_key, {}).get(query_name)
+            if isinstance(values, list) and any(v in values for v in (value, *aliases)):
+                return False
+            self._append({"op": "ladd", "u": user_id, "k": var_key, "q": query_name, "v": value})
+            return True
+
+    def remove_list_var(self, user_id: str, var_key: str, query_name: str, value: str, aliases: tuple = ()) -> bool:
+        with self._lock:
+            values = self._state["vars"].get(user_id, {}).get(var_key, {}).get(query_name)
+            present = [v for v in (value, *aliases) if isinstance(values, list) and v in values]
+            if not present:
+                return False
+            self._append(*({"op": "ldel", "u": user_id, "k": var_key, "q": query_name, "v": v} for v in present))
+            return True
+
+    def remove_user(self, user_id: str):
+        with self._lock:
+            if user_id in self._state["vars"]:
+                self._append({"op": "udel", "u": user_id})
+
+    def get_bots(self) -> list:
+        with self._lock:
+            return [{"user_id": user_id, **data} for user_id, data in self._state["bots"].items()]
+
+    def save_bot(self, user_id: str, bot_data: dict):
+        self._append({"op": "bot", "u": user_id, "d": bot_data})
+
+    def remove_bot(self, user_id: str):
+        with self._lock:
+            if user_id in self._state["bots"]:
+                self._append({"op": "bdel", "u": user_id})
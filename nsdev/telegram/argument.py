@@ -1,14 +1,16 @@
-import asyncio
 import random
 from datetime import datetime
 from typing import Optional, Tuple, Union
 
 import pyrogram
 
+from .scheduler import OutboundScheduler
+
 
 class Argument:
     def __init__(self, client):
         self.client: pyrogram.Client = client
+        self._scheduler = OutboundScheduler.for_client(client)
 
     def getMention(
         self,
@@ -133,8 +135,7 @@ class Argument:
 
     async def copyMessage(self, chatId: int, msgId: int, chatTarget: int):
         try:
-            await self.client.copy_message(chatTarget, chatId, msgId)
-            await asyncio.sleep(1)
+            await self._scheduler.send(chatTarget, self.client.copy_message, chatTarget, chatId, msgId)
         except Exception:
             pass
 
@@ -4,11 +4,12 @@ import re
 from typing import Optional, Tuple
 from urllib.parse import parse_qs, urlparse
 
-from pyrogram.errors import FloodWait, RPCError
+from pyrogram.errors import RPCError
 from pyrogram.types import Message
 
 from ..utils.logger import LoggerHandler
 from ..utils.progress import TelegramProgressBar
+from .scheduler import OutboundScheduler
 
 
 class MessageCopier:
@@ -16,6 +17,7 @@ class MessageCopier:
         self._client = client
         self._log = LoggerHandler()
         self._peer_cache = {}
+        self._scheduler = OutboundScheduler.for_client(client)
 
     def _parse_link(self, link: str) -> Tuple[Optional[str or int], Optional[int]]:
         link = link.strip()
@@ -52,12 +54,12 @@ class MessageCopier:
         if isinstance(chat_id, int) and chat_id < 0:
             if chat_id not in self._peer_cache:
                 try:
-                    await self._client.resolve_peer(chat_id)
+                    await self._scheduler.call(None, self._client.resolve_peer, chat_id)
                     self._peer_cache[chat_id] = True
                 except Exception as e:
                     raise RPCError(f"Gagal akses chat {chat_id}. Pastikan Anda anggota. Detail: {e}")
 
-        return await self._client.get_messages(chat_id, msg_id)
+        return await self._scheduler.call(None, self._client.get_messages, chat_id, msg_id)
 
     async def _process_single_message(
         self, message: Message, user_chat_id: int, status_message: Message, custom_thumb_path: str = None
@@ -69,11 +71,13 @@ class MessageCopier:
             download_progress = TelegramProgressBar(self._client, status_message, "Downloading")
 
             if not message.media:
-                return await message.copy(user_chat_id)
+                return await self._scheduler.send(user_chat_id, message.copy, user_chat_id)
 
-            file_path = await self._client.download_media(message, progress=download_progress.update)
+            file_path = await self._scheduler.call(
+                None, self._client.download_media, message, progress=download_progress.update
+            )
             if not file_path or not os.path.exists(file_path):
-                return await message.copy(user_chat_id)
+                return await self._scheduler.send(user_chat_id, message.copy, user_chat_id)
 
             media_obj = getattr(message, message.media.value, None)
 
@@ -82,7 +86,9 @@ class MessageCopier:
                 thumb_to_use = custom_thumb_path
             elif media_obj and hasattr(media_obj, "thumbs") and media_obj.thumbs:
                 try:
-                    original_thumb_path = await self._client.download_media(media_obj.thumbs[0].file_id)
+                    original_thumb_path = await self._scheduler.call(
+                        None, self._client.download_media, media_obj.thumbs[0].file_id
+                    )
                     thumb_to_use = original_thumb_path
                 except Exception:
                     pass
@@ -116,9 +122,9 @@ class MessageCopier:
                 if thumb_to_use and media_type in ["video", "audio", "document"]:
                     kwargs["thumb"] = thumb_to_use
 
-                await send_func(**kwargs)
+                await self._scheduler.send(user_chat_id, send_func, **kwargs)
             else:
-                await message.copy(user_chat_id)
+                await self._scheduler.send(user_chat_id, message.copy, user_chat_id)
 
         finally:
             for path in [file_path, original_thumb_path]:
@@ -134,9 +140,11 @@ class MessageCopier:
         try:
             if custom_thumb_message_id:
                 await status_message.edit("📥 Mengunduh thumbnail kustom...")
-                thumb_message = await self._client.get_messages(user_chat_id, custom_thumb_message_id)
+                thumb_message = await self._scheduler.call(
+                    None, self._client.get_messages, user_chat_id, custom_thumb_message_id
+                )
                 if thumb_message.photo:
-                    custom_thumb_path = await self._client.download_media(thumb_message)
+                    custom_thumb_path = await self._scheduler.call(None, self._client.download_media, thumb_message)
                 else:
                     await status_message.edit("⚠️ Balasan bukan foto, thumbnail kustom diabaikan.")
                     await asyncio.sleep(2)
@@ -165,13 +173,12 @@ class MessageCopier:
             if not links_to_process:
                 raise ValueError("Tidak ada link valid yang ditemukan.")
 
-            await status_message.edit(f"Siap menyalin {len(links_to_process)} pesan...")
-            await asyncio.sleep(2)
+            await self._scheduler.edit(status_message, f"Siap menyalin {len(links_to_process)} pesan...")
 
             total = len(links_to_process)
             for i, (chat_id, msg_id) in enumerate(links_to_process):
                 try:
-                    await status_message.edit(f"Memproses pesan {i+1}/{total} (ID: {msg_id})...")
+                    await self._scheduler.edit(status_message, f"Memproses pesan {i+1}/{total} (ID: {msg_id})...")
 
                     target_message = await self._get_and_verify_message(chat_id, msg_id)
                     if target_message.empty:
@@ -180,24 +187,11 @@ class MessageCopier:
                     await self._process_single_message(
                         target_message, user_chat_id, status_message, custom_thumb_path=custom_thumb_path
                     )
-                    await asyncio.sleep(1.5)
-
-                except FloodWait as e:
-                    wait_time = e.value + 5
-                    self._log.print(f"{self._log.YELLOW}FloodWait: tunggu {wait_time} detik...{self._log.RESET}")
-                    await asyncio.sleep(wait_time)
-                    try:
-                        target_message = await self._get_and_verify_message(chat_id, msg_id)
-                        if not target_message.empty:
-                            await self._process_single_message(
-                                target_message, user_chat_id, status_message, custom_thumb_path=custom_thumb_path
-                            )
-                    except Exception as retry_e:
-                        self._log.error(f"Gagal retry setelah FloodWait ({chat_id}/{msg_id}): {retry_e}")
+
                 except Exception as e:
                     self._log.error(f"Gagal memproses ({chat_id}/{msg_id}): {e}")
 
-            await status_message.edit("✅ **Selesai!**")
+            await self._scheduler.edit(status_message, "✅ **Selesai!**")
             await asyncio.sleep(3)
             await status_message.delete()
 
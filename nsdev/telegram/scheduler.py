@@ -0,0 +1,142 @@
+import asyncio
+import time
+from collections import Counter, OrderedDict
+
+from pyrogram.errors import FloodWait
+
+from ..utils.logger import LoggerHandler
+
+
+class _Lane:
+    __slots__ = ("base_rate", "rate", "capacity", "tokens", "updated", "blocked_until")
+
+    def __init__(self, rate: float, capacity: float, now: float):
+        self.base_rate = rate
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated = now
+        self.blocked_until = 0.0
+
+    def refill(self, now: float) -> float:
+        self.tokens = min(self.capacity, self.tokens + max(0.0, now - self.updated) * self.rate)
+        self.updated = now
+        return max(self.blocked_until - now, (1 - self.tokens) / self.rate if self.tokens < 1 else 0.0)
+
+
+class OutboundScheduler:
+    SEND = 0
+    EDIT = 1
+
+    def __init__(self, client, **options):
+        self._client = client
+        self._log = LoggerHandler()
+        self.global_rate = options.get("global_rate", 30)
+        self.private_rate = options.get("private_rate", 1)
+        self.group_rate = options.get("group_rate", 20 / 60)
+        self.max_retries = options.get("max_retries", 3)
+        self.idle_seconds = options.get("idle_seconds", 600)
+        self.min_factor = options.get("min_factor", 0.125)
+        self.recovery = options.get("recovery", 0.1)
+        self.max_edit_delay = options.get("max_edit_delay", 5)
+        self._global = _Lane(self.global_rate, self.global_rate, time.monotonic())
+        self._chats = OrderedDict()
+        self._waiting_sends = Counter()
+
+    @classmethod
+    def for_client(cls, client, **options):
+        scheduler = getattr(client, "_nsdev_scheduler", None)
+        if scheduler is None:
+            scheduler = cls(client, **options)
+            try:
+                client._nsdev_scheduler = scheduler
+            except AttributeError:
+                pass
+        return scheduler
+
+    def _lane(self, chat_id, now: float, priority: int = SEND) -> _Lane:
+        if chat_id is None:
+            return self._global
+        lane_id = chat_id if priority == self.SEND else (priority, chat_id)
+        lane = self._chats.pop(lane_id, None)
+        while self._chats:
+            idle_id = next(iter(self._chats))
+            idle = self._chats[idle_id]
+            if idle.updated + self.idle_seconds > now or idle.blocked_until > now:
+                break
+            del self._chats[idle_id]
+        if lane is None:
+            lane = _Lane(self.group_rate if isinstance(chat_id, int) and chat_id < 0 else self.private_rate, 1, now)
+        self._chats[lane_id] = lane
+        return lane
+
+    def _take(self, chat_id, priority: int = SEND) -> float:
+        now = time.monotonic()
+        lanes = (self._global,) if chat_id is None else (self._global, self._lane(chat_id, now, priority))
+        wait = max(lane.refill(now) for lane in lanes)
+        if not wait:
+            for lane in lanes:
+                lane.tokens -= 1
+        return wait
+
+    async def acquire(self, chat_id=None, priority: int = SEND):
+        if priority == self.SEND:
+            self._waiting_sends[chat_id] += 1
+        deadline = time.monotonic() + self.max_edit_delay
+        try:
+            while True:
+                if priority > self.SEND and self._waiting_sends[chat_id] and time.monotonic() < deadline:
+                    await asyncio.sleep(1 / self.global_rate)
+                    continue
+                wait = self._take(chat_id, priority)
+                if not wait:
+                    return
+                await asyncio.sleep(wait)
+        finally:
+            if priority == self.SEND:
+                self._waiting_sends[chat_id] -= 1
+                if not self._waiting_sends[chat_id]:
+                    del self._waiting_sends[chat_id]
+
+    def penalize(self, chat_id, seconds: float, priority: int = SEND):
+        now = time.monotonic()
+        lane = self._lane(chat_id, now, priority)
+        lane.refill(now)
+        lane.tokens = 0.0
+        lane.blocked_until = max(lane.blocked_until, now + seconds)
+        lane.rate = max(lane.base_rate * self.min_factor, lane.rate / 2)
+
+    def _recover(self, chat_id, priority: int = SEND):
+        lane = (
+            self._global
+            if chat_id is None
+            else self._chats.get(chat_id if priority == self.SEND else (priority, chat_id))
+        )
+        if lane is not None and lane.rate < lane.base_rate:
+            lane.rate = min(lane.base_rate, lane.rate + lane.base_rate * self.recovery)
+
+    async def call(self, chat_id, func, *args, priority: int = SEND, **kwargs):
+        for attempt in range(self.max_retries + 1):
+            await self.acquire(chat_id, priority)
+            try:
+                result = await func(*args, **kwargs)
+            except FloodWait as e:
+                if attempt == self.max_retries:
+                    raise
+                self._log.print(f"{self._log.YELLOW}FloodWait {chat_id}: tunggu {e.value} detik...{self._log.RESET}")
+                self.penalize(chat_id, e.value, priority)
+                continue
+            self._recover(chat_id, priority)
+            return result
+
+    async def send(self, chat_id, func, *args, **kwargs):
+        return await self.call(chat_id, func, *args, priority=self.SEND, **kwargs)
+
+    async def edit(self, message, *args, **kwargs):
+        return await self.call(message.chat.id, message.edit, *args, priority=self.EDIT, **kwargs)
+
+    def rate(self, chat_id=None) -> float:
+        lane = self._global if chat_id is None else self._chats.get(chat_id)
+        if lane is None:
+            return self.group_rate if isinstance(chat_id, int) and chat_id < 0 else self.private_rate
+        return lane.rate
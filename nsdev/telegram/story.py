@@ -7,12 +7,14 @@ from pyrogram.raw import functions, types
 from pyrogram.types import Document, Message, Photo
 
 from ..utils.logger import LoggerHandler
+from .scheduler import OutboundScheduler
 
 
 class StoryDownloader:
     def __init__(self, client):
         self._client = client
         self._log = LoggerHandler()
+        self._scheduler = OutboundScheduler.for_client(client)
 
     async def _process_and_send_story(self, story_item: types.StoryItem, target_chat_id: int, msg_id: int):
         downloaded_path = None
@@ -33,13 +35,14 @@ class StoryDownloader:
                 send_method = self._client.send_video
 
             if high_level_media and send_method:
-                downloaded_path = await self._client.download_media(high_level_media)
-                await send_method(
+                downloaded_path = await self._scheduler.call(None, self._client.download_media, high_level_media)
+                await self._scheduler.send(
+                    target_chat_id,
+                    send_method,
                     target_chat_id,
                     downloaded_path,
                     caption=caption,
                 )
-                await asyncio.sleep(1.5)
 
         except Exception as item_e:
             self._log.warning(f"Gagal memproses satu story item: {item_e}")
@@ -78,8 +81,10 @@ class StoryDownloader:
             processed_count = 0
             for i, story_id in enumerate(story_ids):
                 try:
-                    await status_message.edit_text(f"📥 Mengambil story {i + 1}/{total}...")
-                    story_data = await self._client.invoke(functions.stories.GetStoriesByID(peer=peer, id=[story_id]))
+                    await self._scheduler.edit(status_message, f"📥 Mengambil story {i + 1}/{total}...")
+                    story_data = await self._scheduler.call(
+                        None, self._client.invoke, functions.stories.GetStoriesByID(peer=peer, id=[story_id])
+                    )
 
                     if not story_data.stories:
                         self._log.warning(f"Story ID {story_id} tidak dapat diakses.")
@@ -92,7 +97,6 @@ class StoryDownloader:
 
                     await self._process_and_send_story(story, chat_id, message_id)
                     processed_count += 1
-                    await asyncio.sleep(1.5)
 
                 except Exception as story_err:
                     self._log.print(f"{self._log.YELLOW}Gagal memproses story ID {story_id}: {story_err}")
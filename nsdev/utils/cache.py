@@ -1,36 +1,284 @@
 import asyncio
+import hashlib
+import os
+import pickle
+import sqlite3
+import threading
 import time
+import weakref
+from collections import OrderedDict, namedtuple
 from functools import wraps
 
-_cache = {}
+_caches = weakref.WeakSet()
+_MISSING = object()
 
+CacheInfo = namedtuple("CacheInfo", ["hits", "misses", "maxsize", "currsize"])
 
-def memoize(ttl: int):
+
+def _make_key(args, kwargs):
+    key = (args, tuple(sorted(kwargs.items()))) if kwargs else args
+    try:
+        hash(key)
+    except TypeError:
+        return str(key)
+    return key
+
+
+class _Flight:
+    __slots__ = ("task", "waiters")
+
+    def __init__(self, task):
+        self.task = task
+        self.waiters = 0
+
+
+def _stable_repr(value):
+    if type(value).__repr__ is object.__repr__:
+        raise TypeError(
+            f"memoize(persist=...) tidak bisa membuat kunci stabil untuk objek {type(value).__qualname__}; "
+            "berikan key=fungsi(*args, **kwargs) yang mengembalikan string unik."
+        )
+    return repr(value)
+
+
+class PersistentCache:
+    _instances = {}
+    _instances_lock = threading.Lock()
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        self.conn.execute("PRAGMA busy_timeout = 5000")
+        self.conn.execute("PRAGMA journal_mode = WAL")
+        self.conn.execute("PRAGMA synchronous = NORMAL")
+        self.conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS memoize (
+                func TEXT NOT NULL, key TEXT NOT NULL, value BLOB NOT NULL,
+                fresh_until REAL, expires_at REAL,
+                PRIMARY KEY (func, key)
+            ) WITHOUT ROWID
+        """
+        )
+        self.conn.execute("DELETE FROM memoize WHERE expires_at <= ?", (time.time(),))
+        self.conn.commit()
+
+    @classmethod
+    def open(cls, path: str):
+        path = os.path.abspath(path)
+        with cls._instances_lock:
+            if path not in cls._instances:
+                cls._instances[path] = cls(path)
+            return cls._instances[path]
+
+    @staticmethod
+    def make_key(args, kwargs) -> str:
+        parts = [_stable_repr(arg) for arg in args] + [f"{k}={_stable_repr(v)}" for k, v in sorted(kwargs.items())]
+        return hashlib.sha256("\x1f".join(parts).encode("utf-8")).hexdigest()
+
+    def get(self, func: str, key: str):
+        with self._lock:
+            row = self.conn.execute(
+                "SELECT value, fresh_until, expires_at FROM memoize WHERE func = ? AND key = ?", (func, key)
+            ).fetchone()
+        if row is None or (row[2] is not None and row[2] <= time.time()):
+            return _MISSING
+        try:
+            return pickle.loads(row[0]), row[1], row[2]
+        except Exception:
+            return _MISSING
+
+    def set(self, func: str, key: str, value, fresh_until: float = None, expires_at: float = None):
+        try:
+            blob = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        except Exception:
+            return
+        with self._lock:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO memoize (func, key, value, fresh_until, expires_at) VALUES (?, ?, ?, ?, ?)",
+                (func, key, blob, fresh_until, expires_at),
+            )
+            self.conn.commit()
+
+    def clear(self, func: str = None):
+        with self._lock:
+            if func is None:
+                self.conn.execute("DELETE FROM memoize")
+            else:
+                self.conn.execute("DELETE FROM memoize WHERE func = ?", (func,))
+            self.conn.commit()
+
+
+def memoize(ttl: float = None, maxsize: int = 128, stale_ttl: float = None, persist: str = None, key=None):
     def decorator(func):
-        @wraps(func)
-        async def wrapped(*args, **kwargs):
-            key_parts = [func.__name__] + list(args) + sorted(kwargs.items())
-            key = str(key_parts)
+        lifetime = ttl + stale_ttl if ttl and stale_ttl else ttl
+        cache = LRUCache(maxsize, lifetime)
+        _caches.add(cache)
+        store = PersistentCache.open(persist) if persist else None
+        name = f"{func.__module__}.{func.__qualname__}"
+        is_coroutine = asyncio.iscoroutinefunction(func)
+        inflight = {}
 
-            current_time = time.time()
+        def persist_key(args, kwargs):
+            return key(*args, **kwargs) if key is not None else PersistentCache.make_key(args, kwargs)
+
+        async def remember(cache_key, args, kwargs, result):
+            now = time.time()
+            fresh_until = now + ttl if ttl else None
+            cache.set(cache_key, (result, fresh_until))
+            if store is not None:
+                expires_at = now + lifetime if lifetime else None
+                await asyncio.get_running_loop().run_in_executor(
+                    None, store.set, name, persist_key(args, kwargs), result, fresh_until, expires_at
+                )
+            return result
 
-            if key in _cache:
-                result, timestamp = _cache[key]
-                if current_time - timestamp < ttl:
-                    return result
+        async def lookup(cache_key, args, kwargs):
+            entry = cache.get(cache_key, _MISSING)
+            if entry is _MISSING and store is not None:
+                row = await asyncio.get_running_loop().run_in_executor(None, store.get, name, persist_key(args, kwargs))
+                if row is not _MISSING:
+                    result, fresh_until, expires_at = row
+                    entry = (result, fresh_until)
+                    cache.set(cache_key, entry, ttl=expires_at - time.time() if expires_at else None)
+            return entry
 
-            if asyncio.iscoroutinefunction(func):
+        async def fill(cache_key, args, kwargs):
+            if is_coroutine:
                 result = await func(*args, **kwargs)
             else:
-                result = func(*args, **kwargs)
+                result = await asyncio.get_running_loop().run_in_executor(None, lambda: func(*args, **kwargs))
+            return await remember(cache_key, args, kwargs, result)
 
-            _cache[key] = (result, current_time)
-            return result
+        def start(cache_key, args, kwargs):
+            flight = inflight.get(cache_key)
+            if (
+                flight is not None
+                and not flight.task.cancelled()
+                and flight.task.get_loop() is asyncio.get_running_loop()
+            ):
+                return flight
+
+            flight = _Flight(asyncio.ensure_future(fill(cache_key, args, kwargs)))
+            inflight[cache_key] = flight
+
+            def finished(task):
+                if inflight.get(cache_key) is flight:
+                    del inflight[cache_key]
+                if not task.cancelled():
+                    task.exception()
+
+            flight.task.add_done_callback(finished)
+            return flight
+
+        @wraps(func)
+        async def wrapped(*args, **kwargs):
+            cache_key = _make_key(args, kwargs)
+            entry = await lookup(cache_key, args, kwargs)
+            if entry is not _MISSING:
+                result, fresh_until = entry
+                if fresh_until is not None and fresh_until <= time.time():
+                    start(cache_key, args, kwargs)
+                return result
+
+            if not is_coroutine:
+                return await remember(cache_key, args, kwargs, func(*args, **kwargs))
+
+            flight = start(cache_key, args, kwargs)
+            flight.waiters += 1
+            try:
+                return await asyncio.shield(flight.task)
+            finally:
+                flight.waiters -= 1
+                if not flight.waiters and not flight.task.done():
+                    if inflight.get(cache_key) is flight:
+                        del inflight[cache_key]
+                    flight.task.cancel()
+
+        def cache_clear():
+            cache.clear()
+            if store is not None:
+                store.clear(name)
 
+        wrapped.cache = cache
+        wrapped.cache_info = cache.info
+        wrapped.cache_clear = cache_clear
         return wrapped
 
     return decorator
 
 
 def clear_cache():
-    _cache.clear()
+    for cache in list(_caches):
+        cache.clear()
+
+
+class LRUCache:
+    def __init__(self, maxsize: int = 128, ttl: float = None):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._data = OrderedDict()
+        self._lock = threading.RLock()
+        self._next_purge = 0.0
+
+    def get(self, key, default=None):
+        with self._lock:
+            item = self._data.get(key, _MISSING)
+            if item is not _MISSING:
+                value, expires_at = item
+                if expires_at is None or expires_at > time.monotonic():
+                    self._data.move_to_end(key)
+                    self.hits += 1
+                    return value
+                del self._data[key]
+            self.misses += 1
+            return default
+
+    def set(self, key, value, ttl: float = None):
+        ttl = self.ttl if ttl is None else ttl
+        now = time.monotonic()
+        with self._lock:
+            self._data[key] = (value, now + ttl if ttl else None)
+            self._data.move_to_end(key)
+            if self.ttl and now >= self._next_purge and (not self.maxsize or len(self._data) > self.maxsize):
+                self.purge_expired(now)
+            while self.maxsize and len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def purge_expired(self, now: float = None) -> int:
+        now = time.monotonic() if now is None else now
+        with self._lock:
+            expired = [
+                key for key, (_, expires_at) in self._data.items() if expires_at is not None and expires_at <= now
+            ]
+            for key in expired:
+                del self._data[key]
+            if self.ttl:
+                self._next_purge = now + self.ttl / 2
+            return len(expired)
+
+    def pop(self, key, default=None):
+        with self._lock:
+            item = self._data.pop(key, _MISSING)
+            return default if item is _MISSING else item[0]
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def info(self) -> CacheInfo:
+        with self._lock:
+            return CacheInfo(self.hits, self.misses, self.maxsize, len(self._data))
+
+    def __contains__(self, key):
+        with self._lock:
+            item = self._data.get(key, _MISSING)
+            return item is not _MISSING and (item[1] is None or item[1] > time.monotonic())
+
+    def __len__(self):
+        return len(self._data)
@@ -1,68 +1,296 @@
+import asyncio
+import math
+import sqlite3
+import threading
 import time
+from collections import OrderedDict, namedtuple
 from functools import wraps
-from typing import Dict, Tuple
 
 from pyrogram.types import CallbackQuery, Message
 
 from .gradient import Gradient
 
-_user_timestamps: Dict[str, Tuple[int, float]] = {}
+_REDIS_ACQUIRE = """
+local now = tonumber(ARGV[1])
+local levels = {}
+local wait = 0
+for i = 1, #KEYS do
+    local capacity = tonumber(ARGV[3 * i - 1])
+    local per_seconds = tonumber(ARGV[3 * i])
+    local cost = tonumber(ARGV[3 * i + 1])
+    local state = redis.call("HMGET", KEYS[i], "t", "u")
+    local tokens = tonumber(state[1]) or capacity
+    local updated = tonumber(state[2]) or now
+    tokens = math.min(capacity, tokens + math.max(0, now - updated) * capacity / per_seconds)
+    levels[i] = tokens - cost
+    if tokens < cost then
+        wait = math.max(wait, (cost - tokens) * per_seconds / capacity)
+    end
+end
+if wait == 0 then
+    for i = 1, #KEYS do
+        redis.call("HSET", KEYS[i], "t", tostring(levels[i]), "u", tostring(now))
+        redis.call("PEXPIRE", KEYS[i], math.ceil(tonumber(ARGV[3 * i]) * 1000))
+    end
+end
+return tostring(wait)
+"""
+
+
+Limit = namedtuple("Limit", ["limit", "per_seconds", "scope", "name"], defaults=("user", None))
+
+_SCOPES = ("user", "chat", "command", "global")
+
+
+def _bucket_key(rule: Limit, command: str, user_id, chat_id) -> str:
+    if rule.scope == "user":
+        return f"user:{rule.name or command}:{user_id}"
+    if rule.scope == "chat":
+        return f"chat:{rule.name or '*'}:{chat_id}"
+    if rule.scope == "command":
+        return f"command:{rule.name or command}"
+    return f"global:{rule.name or '*'}"
+
+
+def _refill(state, now: float, capacity: float, per_seconds: float) -> float:
+    if state is None:
+        return capacity
+    tokens, updated = state
+    return min(capacity, tokens + max(0.0, now - updated) * capacity / per_seconds)
+
+
+def _settle(levels, buckets) -> float:
+    return max(
+        ((cost - tokens) * per_seconds / capacity for tokens, (_, capacity, per_seconds, cost) in zip(levels, buckets)),
+        default=0.0,
+    )
+
+
+class RateLimitStore:
+    blocking = True
+
+    def acquire(self, buckets: list) -> float:
+        raise NotImplementedError
+
+    def clear(self):
+        raise NotImplementedError
+
+    def close(self):
+        pass
+
+
+class TokenBucket:
+    def __init__(self, per_seconds: float):
+        self.per_seconds = per_seconds
+        self._buckets = OrderedDict()
+
+    def level(self, key, now: float, capacity: float) -> float:
+        return _refill(self._buckets.get(key), now, capacity, self.per_seconds)
+
+    def store(self, key, tokens: float, now: float):
+        self._buckets.pop(key, None)
+        self._buckets[key] = (tokens, now)
+
+    def evict(self, now: float):
+        buckets = self._buckets
+        while buckets:
+            key = next(iter(buckets))
+            if buckets[key][1] + self.per_seconds > now:
+                break
+            del buckets[key]
+
+    def __len__(self):
+        return len(self._buckets)
+
+
+class MemoryStore(RateLimitStore):
+    blocking = False
+
+    def __init__(self):
+        self._tables = {}
+        self._lock = threading.Lock()
+
+    def acquire(self, buckets: list) -> float:
+        now = time.monotonic()
+        with self._lock:
+            tables, levels = [], []
+            for key, capacity, per_seconds, cost in buckets:
+                table = self._tables.get(per_seconds)
+                if table is None:
+                    table = self._tables[per_seconds] = TokenBucket(per_seconds)
+                table.evict(now)
+                tables.append(table)
+                levels.append(table.level(key, now, capacity))
+
+            if any(tokens < bucket[3] for tokens, bucket in zip(levels, buckets)):
+                return _settle(levels, buckets)
+            for table, tokens, (key, _, _, cost) in zip(tables, levels, buckets):
+                table.store(key, tokens - cost, now)
+            return 0.0
+
+    def clear(self):
+        with self._lock:
+            self._tables.clear()
+
+    def __len__(self):
+        return sum(len(table) for table in self._tables.values())
+
+
+class SQLiteStore(RateLimitStore):
+    def __init__(self, path: str = "ratelimit.db", purge_interval: float = 60):
+        self.path = path
+        self.purge_interval = purge_interval
+        self._next_purge = 0.0
+        self._lock = threading.Lock()
+        self.conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self.conn.execute("PRAGMA busy_timeout = 5000")
+        self.conn.execute("PRAGMA journal_mode = WAL")
+        self.conn.execute("PRAGMA synchronous = NORMAL")
+        self.conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS ratelimit (
+                key TEXT PRIMARY KEY, tokens REAL NOT NULL, updated REAL NOT NULL, expires_at REAL NOT NULL
+            ) WITHOUT ROWID
+        """
+        )
+        self.conn.execute("CREATE INDEX IF NOT EXISTS idx_ratelimit_expires ON ratelimit (expires_at)")
+
+    def acquire(self, buckets: list) -> float:
+        now = time.time()
+        keys = [bucket[0] for bucket in buckets]
+        with self._lock:
+            self.conn.execute("BEGIN IMMEDIATE")
+            try:
+                if now >= self._next_purge:
+                    self.conn.execute("DELETE FROM ratelimit WHERE expires_at <= ?", (now,))
+                    self._next_purge = now + self.purge_interval
+                rows = self.conn.execute(
+                    f"SELECT key, tokens, updated FROM ratelimit WHERE key IN ({','.join('?' * len(keys))})", keys
+                ).fetchall()
+                states = {key: (tokens, updated) for key, tokens, updated in rows}
+                levels = [
+                    _refill(states.get(key), now, capacity, per_seconds) for key, capacity, per_seconds, _ in buckets
+                ]
+
+                if any(tokens < bucket[3] for tokens, bucket in zip(levels, buckets)):
+                    wait = _settle(levels, buckets)
+                else:
+                    wait = 0.0
+                    self.conn.executemany(
+                        "INSERT OR REPLACE INTO ratelimit (key, tokens, updated, expires_at) VALUES (?, ?, ?, ?)",
+                        [
+                            (key, tokens - cost, now, now + per_seconds)
+                            for tokens, (key, _, per_seconds, cost) in zip(levels, buckets)
+                        ],
+                    )
+                self.conn.execute("COMMIT")
+            except BaseException:
+                self.conn.execute("ROLLBACK")
+                raise
+        return wait
+
+    def clear(self):
+        with self._lock:
+            self.conn.execute("DELETE FROM ratelimit")
+
+    def close(self):
+        self.conn.close()
+
+
+class RedisStore(RateLimitStore):
+    def __init__(self, client=None, url: str = "redis://localhost:6379/0", prefix: str = "ratelimit"):
+        self.prefix = prefix
+        self.client = client
+        self._owns_client = client is None
+        if client is None:
+            import redis
+
+            self.client = redis.Redis.from_url(url)
+        self._acquire = self.client.register_script(_REDIS_ACQUIRE)
+
+    def acquire(self, buckets: list) -> float:
+        args = [time.time()]
+        for _, capacity, per_seconds, cost in buckets:
+            args += [capacity, per_seconds, cost]
+        return float(self._acquire(keys=[f"{self.prefix}:{bucket[0]}" for bucket in buckets], args=args))
+
+    def clear(self):
+        keys = list(self.client.scan_iter(match=f"{self.prefix}:*", count=1000))
+        if keys:
+            self.client.delete(*keys)
+
+    def close(self):
+        if self._owns_client:
+            self.client.close()
 
 
 class RateLimiter(Gradient):
-    def __init__(self, client):
+    def __init__(self, client, store: RateLimitStore = None):
         super().__init__()
         self._client = client
+        self.store = store or MemoryStore()
+
+    async def acquire(self, buckets: list, store: RateLimitStore = None) -> float:
+        store = store or self.store
+        if store.blocking:
+            return await asyncio.to_thread(store.acquire, buckets)
+        return store.acquire(buckets)
+
+    def __call__(self, limit=None, per_seconds: int = None, store: RateLimitStore = None, cost: float = 1):
+        if isinstance(limit, (int, float)):
+            rules = [Limit(limit, per_seconds)]
+        elif isinstance(limit, Limit):
+            rules = [limit]
+        else:
+            rules = list(limit or ())
+        if not rules:
+            raise ValueError("ratelimit membutuhkan minimal satu batas.")
+        for rule in rules:
+            if rule.scope not in _SCOPES:
+                raise ValueError(f"Scope tidak dikenal: {rule.scope!r}. Pilih salah satu dari {_SCOPES}.")
+            if cost > rule.limit:
+                raise ValueError(f"Biaya {cost} melebihi kapasitas batas {rule}.")
 
-    def __call__(self, limit: int, per_seconds: int):
         def decorator(func):
+            command = f"{func.__module__}.{func.__qualname__}"
+
             @wraps(func)
             async def wrapped(client, update, *args, **kwargs):
                 if isinstance(update, Message):
-                    user_id = update.from_user.id
+                    chat = update.chat
                 elif isinstance(update, CallbackQuery):
-                    user_id = update.from_user.id
+                    chat = update.message.chat if update.message else None
                 else:
                     return await func(client, update, *args, **kwargs)
 
-                key = f"{user_id}:{id(func)}"
-
-                current_time = time.time()
-
-                if key in _user_timestamps:
-                    count, last_time = _user_timestamps[key]
-
-                    time_passed = current_time - last_time
-                    if time_passed < per_seconds:
-                        if count >= limit:
-                            time_to_wait = per_seconds - time_passed
-                            time_str = self.gettime(int(time_to_wait))
-
-                            fmt = client.ns.telegram.formatter(mode="html")
-                            error_text = (
-                                fmt.bold("⏳ Batas Penggunaan Tercapai ⏳")
-                                .new_line(2)
-                                .text("Anda telah mencapai batas penggunaan untuk perintah ini.")
-                                .new_line()
-                                .text(f"Silakan coba lagi dalam ")
-                                .bold(time_str)
-                                .text(".")
-                            )
-
-                            if isinstance(update, Message):
-                                await update.reply_text(fmt.blockquote(error_text), quote=True)
-                            elif isinstance(update, CallbackQuery):
-                                await update.answer(
-                                    f"Batas penggunaan tercapai. Coba lagi dalam {time_str}.", show_alert=True
-                                )
-
-                            return
-
-                        _user_timestamps[key] = (count + 1, last_time)
-                    else:
-                        _user_timestamps[key] = (1, current_time)
-                else:
-                    _user_timestamps[key] = (1, current_time)
+                user_id = update.from_user.id if update.from_user else None
+                chat_id = chat.id if chat else user_id
+                buckets = [
+                    (_bucket_key(rule, command, user_id or chat_id, chat_id), rule.limit, rule.per_seconds, cost)
+                    for rule in rules
+                ]
+
+                time_to_wait = await self.acquire(buckets, store)
+                if time_to_wait:
+                    time_str = self.gettime(math.ceil(time_to_wait))
+
+                    fmt = client.ns.telegram.formatter(mode="html")
+                    error_text = (
+                        fmt.bold("⏳ Batas Penggunaan Tercapai ⏳")
+                        .new_line(2)
+                        .text("Anda telah mencapai batas penggunaan untuk perintah ini.")
+                        .new_line()
+                        .text(f"Silakan coba lagi dalam ")
+                        .bold(time_str)
+                        .text(".")
+                    )
+
+                    if isinstance(update, Message):
+                        await update.reply_text(fmt.blockquote(error_text), quote=True)
+                    elif isinstance(update, CallbackQuery):
+                        await update.answer(f"Batas penggunaan tercapai. Coba lagi dalam {time_str}.", show_alert=True)
+
+                    return
 
                 return await func(client, update, *args, **kwargs)
 
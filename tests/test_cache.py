@@ -0,0 +1,26 @@
+import asyncio
+
+from nsdev.utils.cache import memoize
+
+
+def test_call_after_last_waiter_cancelled_starts_a_new_flight():
+    calls = []
+
+    @memoize(ttl=60)
+    async def square(x):
+        calls.append(x)
+        await asyncio.sleep(0.01)
+        return x * x
+
+    async def scenario():
+        first = asyncio.ensure_future(square(3))
+        await asyncio.sleep(0)
+        first.cancel()
+        try:
+            await first
+        except asyncio.CancelledError:
+            pass
+        return await square(3)
+
+    assert asyncio.run(scenario()) == 9
+    assert calls == [3, 3]
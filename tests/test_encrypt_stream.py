@@ -0,0 +1,31 @@
+import io
+
+from nsdev.code.encrypt import CipherHandler
+
+
+def _leading_magic_plaintext(cipher):
+    keystream = cipher.encryptor().update(bytes(4))[4:]
+    return bytes(a ^ b for a, b in zip(b"NSE1", keystream)) + b" payload"
+
+
+def test_stream_roundtrip_when_ciphertext_starts_with_magic():
+    cipher = CipherHandler(key="my_s3cr3t_k3y_@2024!", method="bytes")
+    plaintext = _leading_magic_plaintext(cipher)
+
+    encryptor = cipher.encryptor()
+    encrypted = encryptor.update(b"") + encryptor.update(plaintext) + encryptor.finalize()
+    assert encrypted[4:8] == b"NSE1"
+
+    decryptor = cipher.decryptor()
+    decrypted = b"".join(decryptor.update(encrypted[i : i + 3]) for i in range(0, len(encrypted), 3))
+    assert decrypted + decryptor.finalize() == plaintext
+
+
+def test_file_roundtrip_when_ciphertext_starts_with_magic():
+    cipher = CipherHandler(key="my_s3cr3t_k3y_@2024!", method="bytes")
+    plaintext = _leading_magic_plaintext(cipher)
+
+    encrypted, decrypted = io.BytesIO(), io.BytesIO()
+    cipher.encrypt_file(io.BytesIO(plaintext), encrypted)
+    cipher.decrypt_file(io.BytesIO(encrypted.getvalue()), decrypted)
+    assert decrypted.getvalue() == plaintext